@@ -1,27 +1,97 @@
 #include "build_trigger.hpp"
 #include <Windows.h>
+#include <algorithm>
+#include <cctype>
 #include <filesystem>
+#include <fstream>
+#include <iterator>
 #include <sstream>
 #include <vector>
 
 namespace MDB {
 namespace Build {
 
-static std::string ReadPipeToString(HANDLE hReadPipe) {
+// Fallback MSBuild locations for modern VS installations, probed in order.
+// NOTE: Do NOT include old .NET Framework MSBuild (v4.0.30319) — it cannot
+// build SDK-style projects and will fail with MSB4041.
+static const char* const MSBUILD_SEARCH_PATHS[] = {
+    // Visual Studio 2022
+    "C:\\Program Files\\Microsoft Visual Studio\\2022\\Enterprise\\MSBuild\\Current\\Bin\\MSBuild.exe",
+    "C:\\Program Files\\Microsoft Visual Studio\\2022\\Professional\\MSBuild\\Current\\Bin\\MSBuild.exe",
+    "C:\\Program Files\\Microsoft Visual Studio\\2022\\Community\\MSBuild\\Current\\Bin\\MSBuild.exe",
+    "C:\\Program Files (x86)\\Microsoft Visual Studio\\2022\\BuildTools\\MSBuild\\Current\\Bin\\MSBuild.exe",
+
+    // Visual Studio 2019
+    "C:\\Program Files (x86)\\Microsoft Visual Studio\\2019\\Enterprise\\MSBuild\\Current\\Bin\\MSBuild.exe",
+    "C:\\Program Files (x86)\\Microsoft Visual Studio\\2019\\Professional\\MSBuild\\Current\\Bin\\MSBuild.exe",
+    "C:\\Program Files (x86)\\Microsoft Visual Studio\\2019\\Community\\MSBuild\\Current\\Bin\\MSBuild.exe",
+    "C:\\Program Files (x86)\\Microsoft Visual Studio\\2019\\BuildTools\\MSBuild\\Current\\Bin\\MSBuild.exe",
+};
+
+// Read a child process's output until it exits. If on_line is set, every
+// non-empty line is passed to it (without the line ending) as soon as it
+// arrives, so long builds report progress instead of going silent.
+static std::string ReadPipeToString(HANDLE hReadPipe, BuildOutputCallback on_line = nullptr) {
     std::string result;
     char buffer[4096];
     DWORD bytesRead;
+    size_t lineStart = 0;
+    
+    auto emitLine = [&](size_t end) {
+        size_t len = end - lineStart;
+        if (len > 0 && result[lineStart + len - 1] == '\r') len--;
+        if (len > 0) on_line(result.substr(lineStart, len).c_str());
+    };
     
-    while (ReadFile(hReadPipe, buffer, sizeof(buffer) - 1, &bytesRead, NULL) && bytesRead > 0) {
-        buffer[bytesRead] = '\0';
-        result += buffer;
+    while (ReadFile(hReadPipe, buffer, sizeof(buffer), &bytesRead, NULL) && bytesRead > 0) {
+        result.append(buffer, bytesRead);
+        if (!on_line) continue;
+        
+        size_t eol;
+        while ((eol = result.find('\n', lineStart)) != std::string::npos) {
+            emitLine(eol);
+            lineStart = eol + 1;
+        }
     }
     
+    // Last line without a trailing newline
+    if (on_line && lineStart < result.size()) emitLine(result.size());
+    
     return result;
 }
 
-std::string FindMSBuild() {
-    // Try vswhere first — most reliable method, works for any VS version/edition
+// MSBuild.exe on PATH (e.g. a Developer Command Prompt environment), found
+// without starting a process. The PATH value is passed as the search path so
+// only its directories are probed; with a NULL path SearchPathA would look in
+// the game's directory, the current directory and System32 first. The legacy
+// .NET Framework MSBuild that some setups put on PATH cannot build SDK-style
+// projects and is ignored.
+static std::string FindMSBuildOnPath() {
+    DWORD pathLen = GetEnvironmentVariableA("PATH", NULL, 0);
+    if (pathLen == 0) return "";
+    std::string pathVar(pathLen, '\0');
+    pathLen = GetEnvironmentVariableA("PATH", &pathVar[0], pathLen);
+    if (pathLen == 0 || pathLen >= pathVar.size()) return "";
+    pathVar.resize(pathLen);
+
+    char found[MAX_PATH];
+    DWORD len = SearchPathA(pathVar.c_str(), "MSBuild.exe", NULL, MAX_PATH, found, NULL);
+    if (len == 0 || len >= MAX_PATH) return "";
+
+    std::string path(found, len);
+    std::string lower = path;
+    std::transform(lower.begin(), lower.end(), lower.begin(),
+                   [](unsigned char c) { return static_cast<char>(std::tolower(c)); });
+    if (lower.find("\\microsoft.net\\framework") != std::string::npos) return "";
+    return path;
+}
+
+static std::string LocateMSBuild() {
+    // A usable MSBuild on PATH is the cheapest answer
+    std::string on_path = FindMSBuildOnPath();
+    if (!on_path.empty()) return on_path;
+    
+    // Otherwise vswhere — most reliable method, works for any VS version/edition
     std::string vswhere_path = "C:\\Program Files (x86)\\Microsoft Visual Studio\\Installer\\vswhere.exe";
     if (std::filesystem::exists(vswhere_path)) {
         // Note: vswhere_path is hardcoded and trusted, command is properly quoted
@@ -38,7 +108,7 @@ std::string FindMSBuild() {
             
             PROCESS_INFORMATION pi = { 0 };
             
-            if (CreateProcessA(NULL, const_cast<char*>(command.c_str()), NULL, NULL, TRUE, 0, NULL, NULL, &si, &pi)) {
+            if (CreateProcessA(vswhere_path.c_str(), const_cast<char*>(command.c_str()), NULL, NULL, TRUE, 0, NULL, NULL, &si, &pi)) {
                 CloseHandle(hWritePipe);
                 
                 std::string output = ReadPipeToString(hReadPipe);
@@ -63,23 +133,7 @@ std::string FindMSBuild() {
     }
     
     // Fallback: check hardcoded paths for modern VS installations
-    // NOTE: Do NOT include old .NET Framework MSBuild (v4.0.30319) — it cannot
-    // build SDK-style projects and will fail with MSB4041.
-    std::vector<std::string> search_paths = {
-        // Visual Studio 2022
-        "C:\\Program Files\\Microsoft Visual Studio\\2022\\Enterprise\\MSBuild\\Current\\Bin\\MSBuild.exe",
-        "C:\\Program Files\\Microsoft Visual Studio\\2022\\Professional\\MSBuild\\Current\\Bin\\MSBuild.exe",
-        "C:\\Program Files\\Microsoft Visual Studio\\2022\\Community\\MSBuild\\Current\\Bin\\MSBuild.exe",
-        "C:\\Program Files (x86)\\Microsoft Visual Studio\\2022\\BuildTools\\MSBuild\\Current\\Bin\\MSBuild.exe",
-        
-        // Visual Studio 2019
-        "C:\\Program Files (x86)\\Microsoft Visual Studio\\2019\\Enterprise\\MSBuild\\Current\\Bin\\MSBuild.exe",
-        "C:\\Program Files (x86)\\Microsoft Visual Studio\\2019\\Professional\\MSBuild\\Current\\Bin\\MSBuild.exe",
-        "C:\\Program Files (x86)\\Microsoft Visual Studio\\2019\\Community\\MSBuild\\Current\\Bin\\MSBuild.exe",
-        "C:\\Program Files (x86)\\Microsoft Visual Studio\\2019\\BuildTools\\MSBuild\\Current\\Bin\\MSBuild.exe",
-    };
-    
-    for (const auto& path : search_paths) {
+    for (const char* path : MSBUILD_SEARCH_PATHS) {
         if (std::filesystem::exists(path)) {
             return path;
         }
@@ -88,32 +142,246 @@ std::string FindMSBuild() {
     return "";
 }
 
-BuildResult TriggerBuild(const std::string& project_path) {
-    BuildResult result = { false, "", "", -1 };
-    
-    // Check if project file exists
-    if (!std::filesystem::exists(project_path)) {
-        result.error_message = "Project file not found: " + project_path;
-        return result;
+// What the last real restore recorded in obj/project.nuget.cache (a no-op
+// restore leaves the file alone)
+struct RestoreCacheInfo {
+    std::string dg_spec_hash;                       // hash of the restore inputs
+    bool success = false;
+    std::vector<std::string> expected_package_files; // .nupkg.sha512 files in the global packages folder
+};
+
+// Read one JSON string starting at the opening quote; pos ends past the closing one
+static std::string ReadJsonString(const std::string& json, size_t& pos) {
+    std::string value;
+    for (pos++; pos < json.size() && json[pos] != '"'; pos++) {
+        if (json[pos] == '\\' && pos + 1 < json.size()) pos++;
+        value += json[pos];
     }
-    
-    // Find MSBuild
-    std::string msbuild_path = FindMSBuild();
-    if (msbuild_path.empty()) {
-        result.error_message = "MSBuild.exe not found. Please install Visual Studio or Build Tools.";
-        return result;
+    pos++;
+    return value;
+}
+
+// Position just after `"key":` and any whitespace, or npos
+static size_t FindJsonKeyValue(const std::string& json, const char* key) {
+    size_t pos = json.find(std::string("\"") + key + "\"");
+    if (pos == std::string::npos) return pos;
+    pos = json.find(':', pos);
+    if (pos == std::string::npos) return pos;
+    return json.find_first_not_of(" \t\r\n", pos + 1);
+}
+
+static bool ReadRestoreCache(const std::filesystem::path& path, RestoreCacheInfo& info) {
+    std::ifstream in(path, std::ios::binary);
+    if (!in.is_open()) return false;
+    std::string json((std::istreambuf_iterator<char>(in)), std::istreambuf_iterator<char>());
+
+    size_t pos = FindJsonKeyValue(json, "dgSpecHash");
+    if (pos == std::string::npos || json[pos] != '"') return false;
+    info.dg_spec_hash = ReadJsonString(json, pos);
+
+    pos = FindJsonKeyValue(json, "success");
+    info.success = pos != std::string::npos && json.compare(pos, 4, "true") == 0;
+
+    pos = FindJsonKeyValue(json, "expectedPackageFiles");
+    if (pos != std::string::npos && json[pos] == '[') {
+        while ((pos = json.find_first_of("\"]", pos)) != std::string::npos && json[pos] == '"') {
+            info.expected_package_files.push_back(ReadJsonString(json, pos));
+        }
     }
+    return !info.dg_spec_hash.empty();
+}
+
+// obj/mdb.restore.stamp: the project file's size and timestamp plus the
+// dgSpecHash of the restore that MDB last ran for it
+static std::filesystem::path RestoreStampPath(const std::filesystem::path& project) {
+    return project.parent_path() / "obj" / "mdb.restore.stamp";
+}
+
+static std::string ProjectStampLine(const std::filesystem::path& project) {
+    std::error_code ec;
+    auto size = std::filesystem::file_size(project, ec);
+    if (ec) return "";
+    auto time = std::filesystem::last_write_time(project, ec);
+    if (ec) return "";
+    return std::to_string(size) + " " + std::to_string(time.time_since_epoch().count());
+}
+
+// True if a restore would change nothing: the last successful restore (per
+// obj/project.nuget.cache) is the one MDB recorded for the project file as it
+// is now, and every package it expects is still in the global packages folder.
+// Comparing against MDB's own stamp rather than file times matters because a
+// no-op restore rewrites neither project.assets.json nor the cache.
+static bool RestoreIsCurrent(const std::string& project_path) {
+    std::filesystem::path project(project_path);
+    RestoreCacheInfo cache;
+    if (!ReadRestoreCache(project.parent_path() / "obj" / "project.nuget.cache", cache) || !cache.success)
+        return false;
+
+    std::ifstream in(RestoreStampPath(project));
+    std::string projectLine, hash;
+    if (!in.is_open() || !std::getline(in, projectLine) || !std::getline(in, hash)) return false;
+    if (projectLine != ProjectStampLine(project) || hash != cache.dg_spec_hash) return false;
+
+    std::error_code ec;
+    for (const auto& file : cache.expected_package_files) {
+        if (!std::filesystem::exists(file, ec)) return false;
+    }
+    return true;
+}
+
+// Record that the project, as it is now, was restored successfully
+static void SaveRestoreStamp(const std::string& project_path) {
+    std::filesystem::path project(project_path);
+    RestoreCacheInfo cache;
+    if (!ReadRestoreCache(project.parent_path() / "obj" / "project.nuget.cache", cache) || !cache.success)
+        return;
+    std::ofstream out(RestoreStampPath(project), std::ios::binary);
+    if (out.is_open()) out << ProjectStampLine(project) << "\n" << cache.dg_spec_hash << "\n";
+}
+
+// Errors a build reports when the restore output it relies on is missing or
+// stale (assets file missing, package or target framework not restored)
+static bool IsRestoreFailure(const std::string& output) {
+    static const char* const RESTORE_ERROR_CODES[] = {
+        "NETSDK1004", "NETSDK1005", "NETSDK1047", "NU1101", "NU1102",
+    };
+    for (const char* code : RESTORE_ERROR_CODES) {
+        if (output.find(code) != std::string::npos) return true;
+    }
+    return false;
+}
+
+// %LOCALAPPDATA%\MDB\msbuild_path.txt: the MSBuild.exe found by an earlier
+// run, so later launches skip vswhere. Empty path if LOCALAPPDATA is unset.
+static std::filesystem::path MSBuildCachePath() {
+    char localAppData[MAX_PATH];
+    DWORD len = GetEnvironmentVariableA("LOCALAPPDATA", localAppData, MAX_PATH);
+    if (len == 0 || len >= MAX_PATH) return {};
+    return std::filesystem::path(localAppData) / "MDB" / "msbuild_path.txt";
+}
+
+// The cached path, if there is one and it still points at an MSBuild.exe
+// (an uninstalled or moved Visual Studio invalidates it)
+static std::string LoadCachedMSBuild(const std::filesystem::path& cache_path) {
+    if (cache_path.empty()) return "";
+    std::ifstream in(cache_path);
+    std::string path;
+    if (!in.is_open() || !std::getline(in, path)) return "";
+
+    std::error_code ec;
+    return std::filesystem::is_regular_file(path, ec) ? path : "";
+}
+
+static void SaveCachedMSBuild(const std::filesystem::path& cache_path, const std::string& msbuild_path) {
+    if (cache_path.empty()) return;
+    std::error_code ec;
+    std::filesystem::create_directories(cache_path.parent_path(), ec);
+    std::ofstream out(cache_path, std::ios::binary);
+    if (out.is_open()) out << msbuild_path << '\n';
+}
+
+std::string FindMSBuild() {
+    // The install does not move while the game runs: spawn vswhere and probe the
+    // fallback paths once. Function-local static init is thread-safe, so a
+    // background lookup and a direct TriggerBuild call never search twice.
+    // Across runs the result is kept in a small cache file.
+    static const std::string msbuild_path = [] {
+        std::filesystem::path cache_path = MSBuildCachePath();
+        std::string path = LoadCachedMSBuild(cache_path);
+        if (path.empty()) {
+            path = LocateMSBuild();
+            if (!path.empty()) SaveCachedMSBuild(cache_path, path);
+        }
+        return path;
+    }();
+    return msbuild_path;
+}
+
+std::string ComputeBuildInputs(const std::string& project_path) {
+    std::filesystem::path project(project_path);
+    std::filesystem::path projectDir = project.parent_path();
+    std::vector<std::filesystem::path> inputs = { project };
+
+    std::error_code ec;
+    std::filesystem::recursive_directory_iterator it(projectDir, ec), end;
+    for (; !ec && it != end; it.increment(ec)) {
+        const auto& entry = *it;
+        if (entry.is_directory(ec)) {
+            auto name = entry.path().filename();
+            if (name == "bin" || name == "obj") it.disable_recursion_pending();
+            continue;
+        }
+        if (entry.path().extension() == ".cs") inputs.push_back(entry.path());
+    }
+    if (ec) return "";
+
+    // One "<relative path> <size> <mtime>" line per input, sorted by path, so
+    // an added, removed or renamed file changes the text as surely as an edit
+    std::vector<std::string> lines;
+    lines.reserve(inputs.size());
+    for (const auto& path : inputs) {
+        auto size = std::filesystem::file_size(path, ec);
+        if (ec) return "";
+        auto time = std::filesystem::last_write_time(path, ec);
+        if (ec) return "";
+        lines.push_back(path.lexically_relative(projectDir).generic_string() + " " + std::to_string(size) + " " +
+                        std::to_string(time.time_since_epoch().count()));
+    }
+    std::sort(lines.begin(), lines.end());
+
+    std::string result;
+    for (const auto& line : lines) {
+        result += line;
+        result += '\n';
+    }
+    return result;
+}
+
+// <output>.inputs: the input list the output was last built from
+static std::filesystem::path BuildInputsPath(const std::string& output_path) {
+    return std::filesystem::path(output_path + ".inputs");
+}
+
+bool IsBuildUpToDate(const std::string& output_path, const std::string& inputs) {
+    std::error_code ec;
+    if (inputs.empty() || !std::filesystem::is_regular_file(output_path, ec)) return false;
+
+    std::ifstream in(BuildInputsPath(output_path), std::ios::binary);
+    if (!in.is_open()) return false;
+    std::string recorded((std::istreambuf_iterator<char>(in)), std::istreambuf_iterator<char>());
+    return recorded == inputs;
+}
+
+void SaveBuildInputs(const std::string& output_path, const std::string& inputs) {
+    if (inputs.empty()) return;
+    std::ofstream out(BuildInputsPath(output_path), std::ios::binary);
+    if (out.is_open()) out.write(inputs.data(), static_cast<std::streamsize>(inputs.size()));
+}
+
+BuildResult TriggerBuild(const std::string& project_path) {
+    return TriggerBuild(project_path, FindMSBuild());
+}
+
+// Run one MSBuild invocation on the project, with or without /restore
+static BuildResult RunMSBuild(const std::string& project_path, const std::string& msbuild_path,
+                              bool restore, BuildOutputCallback on_line) {
+    BuildResult result = { false, "", "", -1 };
     
     // Prepare command line
     // Note: Both msbuild_path and project_path are properly quoted to handle spaces
     // and special characters. These paths come from trusted sources (filesystem/registry),
     // not user input, so command injection is not a concern.
     std::stringstream cmd;
-    cmd << "\"" << msbuild_path << "\" \"" << project_path << "\" "
-        << "/restore "
-        << "/p:Configuration=Release "
+    cmd << "\"" << msbuild_path << "\" \"" << project_path << "\" ";
+    if (restore) {
+        cmd << "/restore ";
+    }
+    cmd << "/p:Configuration=Release "
         << "/p:Platform=AnyCPU "
         << "/v:minimal "
+        // No /m: MDB_Core's net472 and net481 builds share one output path
+        // (AppendTargetFrameworkToOutputPath=false), so running them on
+        // parallel nodes would race on writing GameSDK.ModHost.dll
         << "/nologo";
     
     std::string command = cmd.str();
@@ -136,8 +404,10 @@ BuildResult TriggerBuild(const std::string& project_path) {
     
     PROCESS_INFORMATION pi = { 0 };
     
-    // Start MSBuild process
-    if (!CreateProcessA(NULL, const_cast<char*>(command.c_str()), NULL, NULL, TRUE, 0, NULL, NULL, &si, &pi)) {
+    // Start MSBuild process. The executable is named explicitly, so Windows
+    // does not parse the command line and probe the search path to find it;
+    // the command line only carries the arguments (after the quoted argv[0]).
+    if (!CreateProcessA(msbuild_path.c_str(), const_cast<char*>(command.c_str()), NULL, NULL, TRUE, 0, NULL, NULL, &si, &pi)) {
         result.error_message = "Failed to start MSBuild process";
         CloseHandle(hReadPipe);
         CloseHandle(hWritePipe);
@@ -148,7 +418,7 @@ BuildResult TriggerBuild(const std::string& project_path) {
     CloseHandle(hWritePipe);
     
     // Read build output
-    result.build_output = ReadPipeToString(hReadPipe);
+    result.build_output = ReadPipeToString(hReadPipe, on_line);
     CloseHandle(hReadPipe);
     
     // Wait for process to complete
@@ -173,5 +443,39 @@ BuildResult TriggerBuild(const std::string& project_path) {
     return result;
 }
 
+BuildResult TriggerBuild(const std::string& project_path, const std::string& msbuild_path,
+                         BuildOutputCallback on_line) {
+    BuildResult result = { false, "", "", -1 };
+    
+    // Check if project file exists
+    if (!std::filesystem::exists(project_path)) {
+        result.error_message = "Project file not found: " + project_path;
+        return result;
+    }
+    
+    // MSBuild must have been found
+    if (msbuild_path.empty()) {
+        result.error_message = "MSBuild.exe not found. Please install Visual Studio or Build Tools.";
+        return result;
+    }
+    
+    // Restore only when the project has never been restored, has changed
+    // since, or has lost packages from the global packages folder
+    bool restore = !RestoreIsCurrent(project_path);
+    result = RunMSBuild(project_path, msbuild_path, restore, on_line);
+    
+    // The restore check missed something (e.g. obj/ cleaned by hand): build
+    // once more with /restore rather than failing
+    if (!result.success && !restore && IsRestoreFailure(result.build_output)) {
+        restore = true;
+        result = RunMSBuild(project_path, msbuild_path, restore, on_line);
+    }
+    
+    if (result.success && restore) {
+        SaveRestoreStamp(project_path);
+    }
+    return result;
+}
+
 } // namespace Build
 } // namespace MDB
@@ -16,10 +16,33 @@ struct BuildResult {
     int exit_code;
 };
 
+// Receives MSBuild output one line at a time while the build runs
+typedef void (*BuildOutputCallback)(const char* line);
+
 // Trigger MSBuild to compile the MDB_Core project
 BuildResult TriggerBuild(const std::string& project_path);
 
-// Find MSBuild.exe in standard locations
+// Same, with an MSBuild.exe path located earlier (e.g. by a FindMSBuild call
+// run in the background while the wrappers were generated). Empty = not found.
+// on_line, if set, sees each output line as it is produced; build_output still
+// holds the complete output afterwards.
+BuildResult TriggerBuild(const std::string& project_path, const std::string& msbuild_path,
+                         BuildOutputCallback on_line = nullptr);
+
+// Fingerprint of the build inputs: the project file and every .cs file under
+// the project directory (bin/ and obj/ excluded), one sorted
+// "<relative path> <size> <mtime>" line each. Empty if the scan failed.
+std::string ComputeBuildInputs(const std::string& project_path);
+
+// True if output_path exists and was last built from exactly these inputs
+// (as recorded by SaveBuildInputs), i.e. a build would only reproduce it
+bool IsBuildUpToDate(const std::string& output_path, const std::string& inputs);
+
+// Record the inputs output_path was just built from, in <output_path>.inputs
+void SaveBuildInputs(const std::string& output_path, const std::string& inputs);
+
+// Find MSBuild.exe in standard locations. Searched once per process; later
+// calls return the cached result.
 std::string FindMSBuild();
 
 } // namespace Build
@@ -22,6 +22,9 @@ extern "C" void mdb_imgui_shutdown();
 #include <string>
 #include <filesystem>
 #include <atomic>
+#include <future>
+#include <string_view>
+#include <vector>
 
 #pragma comment(lib, "mscoree.lib")
 
@@ -207,6 +210,38 @@ static bool ensure_directory_structure() {
     return true;
 }
 
+// Log the gist of a failed MSBuild run at ERROR level. The full output was
+// already streamed line by line (LOG_DEBUG) while MSBuild ran, so only the
+// error lines are repeated here, or the last few lines if there are none.
+static void log_build_failure_summary(const std::string& output) {
+    constexpr size_t TAIL_LINES = 20;
+    
+    std::vector<std::string_view> lines;
+    std::string_view rest(output);
+    while (!rest.empty()) {
+        size_t eol = rest.find('\n');
+        std::string_view line = rest.substr(0, eol);
+        if (!line.empty() && line.back() == '\r') line.remove_suffix(1);
+        if (!line.empty()) lines.push_back(line);
+        if (eol == std::string_view::npos) break;
+        rest.remove_prefix(eol + 1);
+    }
+    
+    size_t errors = 0;
+    for (auto line : lines) {
+        if (line.find(": error ") != std::string_view::npos) {
+            LOG_ERROR("  %.*s", static_cast<int>(line.size()), line.data());
+            errors++;
+        }
+    }
+    if (errors > 0) return;
+    
+    size_t first = lines.size() > TAIL_LINES ? lines.size() - TAIL_LINES : 0;
+    for (size_t i = first; i < lines.size(); i++) {
+        LOG_ERROR("  %.*s", static_cast<int>(lines[i].size()), lines[i].data());
+    }
+}
+
 // Prepare game SDK by dumping and generating wrappers if needed
 static bool prepare_game_sdk() {
     std::wstring mdb_dir = get_mdb_directory();
@@ -231,17 +266,25 @@ static bool prepare_game_sdk() {
     
     bool dll_exists = std::filesystem::exists(managed_dll);
     
+    bool need_dump = !MDB::Dumper::AreWrappersFresh(generated_dir_str);
+    
     // Check if wrappers already exist and are fresh AND the built DLL exists
-    if (MDB::Dumper::AreWrappersFresh(generated_dir_str) && dll_exists) {
+    if (!need_dump && dll_exists) {
         LOG_INFO("Game SDK wrappers and managed DLL are up to date, skipping");
         return true;
     }
     
-    bool need_dump = !MDB::Dumper::AreWrappersFresh(generated_dir_str);
     bool need_build = need_dump || !dll_exists;
     
     LOG_INFO("=== Game SDK Preparation ===");
     
+    // Locating MSBuild spawns vswhere.exe; run it in the background so it
+    // overlaps with the dump instead of delaying the build step.
+    std::future<std::string> msbuild_path;
+    if (need_build) {
+        msbuild_path = std::async(std::launch::async, MDB::Build::FindMSBuild);
+    }
+    
     // Step 1: Dump IL2CPP metadata and generate buildable C# wrappers (if needed)
     if (need_dump) {
         LOG_INFO("Step 1/2: Dumping IL2CPP metadata & generating C# wrappers...");
@@ -254,8 +297,9 @@ static bool prepare_game_sdk() {
         
         LOG_INFO("  Dumped %zu classes from %zu assemblies", 
                  dump_result.total_classes, dump_result.total_assemblies);
-        LOG_VERBOSE("  Generated %zu wrapper files (%zu classes)",
-                 dump_result.generated_files.size(), dump_result.total_wrappers_generated);
+        LOG_VERBOSE("  Generated %zu wrapper files (%zu classes, %zu files unchanged)",
+                 dump_result.generated_files.size(), dump_result.total_wrappers_generated,
+                 dump_result.unchanged_files);
         if (dump_result.fake_methods_detected > 0 || dump_result.fake_classes_detected > 0) {
             LOG_VERBOSE("  Obfuscation: filtered %zu fake methods, %zu fake classes",
                       dump_result.fake_methods_detected, dump_result.fake_classes_detected);
@@ -269,24 +313,36 @@ static bool prepare_game_sdk() {
         LOG_INFO("Step 1/2: Wrappers up to date, skipping dump");
     }
     
+    // A regenerated SDK is often identical to the last one (e.g. a game patch
+    // that did not touch the type metadata); then the existing DLL still matches.
+    // The inputs are fingerprinted before building so the record describes
+    // exactly what was compiled.
+    std::string managed_dll_str = managed_dll.string();
+    std::string build_inputs;
+    if (need_build) {
+        build_inputs = MDB::Build::ComputeBuildInputs(core_project_str);
+        if (MDB::Build::IsBuildUpToDate(managed_dll_str, build_inputs)) {
+            LOG_INFO("Step 2/2: Managed DLL was built from the current sources, skipping build");
+            need_build = false;
+        }
+    }
+    
     // Step 2: Build MDB_Core project with MSBuild
     if (need_build) {
         LOG_INFO("Step 2/2: Building MDB_Core project...");
         
-        auto build_result = MDB::Build::TriggerBuild(core_project_str);
+        // Stream MSBuild's output while it runs rather than after it exits
+        auto build_result = MDB::Build::TriggerBuild(core_project_str, msbuild_path.get(),
+            [](const char* line) { LOG_DEBUG("  [MSBuild] %s", line); });
         
         if (!build_result.success) {
             LOG_ERROR("Failed to build MDB_Core: %s", build_result.error_message.c_str());
-            if (!build_result.build_output.empty()) {
-                LOG_ERROR("Build output:\n%s", build_result.build_output.c_str());
-            }
+            log_build_failure_summary(build_result.build_output);
             return false;
         }
         
         LOG_INFO("  Build succeeded!");
-        if (!build_result.build_output.empty()) {
-            LOG_DEBUG("Build output:\n%s", build_result.build_output.c_str());
-        }
+        MDB::Build::SaveBuildInputs(managed_dll_str, build_inputs);
     }
     
     LOG_INFO("=== Game SDK Ready ===");
@@ -9,16 +9,22 @@
 #define NOMINMAX
 #include <Windows.h>
 #include <fstream>
-#include <sstream>
 #include <vector>
 #include <chrono>
 #include <iomanip>
 #include <ctime>
+#include <cstring>
+#include <charconv>
+#include <string_view>
 #include <filesystem>
 #include <map>
 #include <set>
+#include <array>
+#include <unordered_map>
+#include <unordered_set>
 #include <algorithm>
-#include <functional>
+#include <thread>
+#include <atomic>
 
 // Convenience aliases into the resolver's internal namespace
 namespace api = il2cpp::_internal;
@@ -31,8 +37,9 @@ namespace Dumper {
 // Constants & Configuration
 // ============================================================================
 
-// Namespaces whose types should NOT be wrapped (BCL / Unity internals)
-static const std::set<std::string> SKIP_NAMESPACES = {
+// Namespaces whose types should NOT be wrapped (BCL / Unity internals).
+// Read-only after static init and probed for every class and type reference.
+static const std::unordered_set<std::string> SKIP_NAMESPACES = {
     "System", "System.Collections", "System.Collections.Generic", "System.IO", "System.Text",
     "System.Threading", "System.Threading.Tasks", "System.Linq", "System.Reflection",
     "System.Runtime", "System.Runtime.CompilerServices", "System.Runtime.InteropServices",
@@ -41,18 +48,31 @@ static const std::set<std::string> SKIP_NAMESPACES = {
     "UnityEngine.Internal", "UnityEngineInternal"
 };
 
+// Namespace prefixes whose whole subtree is skipped
+static const std::string_view SKIP_NAMESPACE_PREFIXES[] = {
+    "System.", "Mono.", "Internal.", "Microsoft.", "MS."
+};
+
 static bool ShouldSkipNamespace(const std::string& ns) {
+    // Global (namespace-less) types are never skipped
+    if (ns.empty()) return false;
     if (SKIP_NAMESPACES.find(ns) != SKIP_NAMESPACES.end()) return true;
-    if (ns.rfind("System.", 0) == 0) return true;
-    if (ns.rfind("Mono.", 0) == 0) return true;
-    if (ns.rfind("Internal.", 0) == 0) return true;
-    if (ns.rfind("Microsoft.", 0) == 0) return true;
-    if (ns.rfind("MS.", 0) == 0) return true;
+    std::string_view view(ns);
+    for (std::string_view prefix : SKIP_NAMESPACE_PREFIXES) {
+        if (view.substr(0, prefix.size()) == prefix) return true;
+    }
     return false;
 }
 
-// Set of fully-qualified type names that will be emitted (populated between Phase 1 and Phase 2)
-static std::set<std::string> g_knownTypes;
+// Types that will be emitted, indexed short name -> namespaces declaring it
+// ("" for global types). Populated between Phase 1 and Phase 2; looked up by
+// (namespace, name) so no fully-qualified string has to be built per query.
+static std::unordered_map<std::string, std::unordered_set<std::string>> g_knownTypes;
+
+static bool IsKnownType(const std::string& ns, const std::string& name) {
+    auto it = g_knownTypes.find(name);
+    return it != g_knownTypes.end() && it->second.count(ns) != 0;
+}
 
 // Obfuscation fake method detector (populated early in DumpIL2CppRuntime)
 static MDB::Obfuscation::Detector* g_obfuscation_detector = nullptr;
@@ -60,6 +80,18 @@ static MDB::Obfuscation::Detector* g_obfuscation_detector = nullptr;
 // Deobfuscation mapping lookup (loaded from mappings.json during dump)
 static MDB::Mappings::MappingLookup g_mappingLookup;
 
+// Stand-in namespace for global (namespace-less) types: used to qualify them
+// (global::Global.X), to bucket them and to name their wrapper file
+static const char* const GLOBAL_NAMESPACE = "Global";
+
+// Written to the wrapper directory after every successful generation; its
+// timestamp is the wrappers' effective age (see AreWrappersFresh)
+static const char* const WRAPPERS_STAMP_FILE = "wrappers.stamp";
+
+// Content hash, size and timestamp of every wrapper file from the last run,
+// so unchanged output is recognised without reading the old files back
+static const char* const WRAPPERS_MANIFEST_FILE = "wrappers.manifest";
+
 // Namespaces whose types are not available in .NET Framework 4.7.2
 static bool IsBlockedNamespace(const std::string& ns) {
     if (ns == "Mono" || ns.rfind("Mono.", 0) == 0) return true;
@@ -70,6 +102,86 @@ static bool IsBlockedNamespace(const std::string& ns) {
     return false;
 }
 
+// ============================================================================
+// Parallel Helpers
+// ============================================================================
+
+// Below this many items ParallelFor runs serially: starting threads (each with
+// cold per-thread name caches) costs more than the work it would split.
+static constexpr size_t PARALLEL_MIN_ITEMS = 4;
+// Upper bound on worker threads. Phase 2 is partly bound by file writes, and
+// every extra worker warms its own copy of the name caches.
+static constexpr size_t PARALLEL_MAX_WORKERS = 16;
+
+/// Run fn(i) for every i in [0, count) on a small pool of worker threads.
+/// Items are handed out through an atomic counter, so one huge assembly next to
+/// many tiny ones still balances. The calling thread (already attached to the
+/// IL2CPP domain) participates as a worker.
+/// fn calls IL2CPP APIs that set up and inflate classes lazily, so every spawned
+/// worker is attached to the domain for its lifetime and detached before it
+/// exits. Without an il2cpp_thread_detach export a worker could not leave the
+/// domain cleanly, so everything then runs serially on the calling thread.
+template <typename Fn>
+static void ParallelFor(size_t count, Fn&& fn) {
+    size_t workers = std::thread::hardware_concurrency();
+    if (workers == 0) workers = 1;
+    workers = (std::min)({ workers, count, PARALLEL_MAX_WORKERS });
+
+    if (workers <= 1 || count < PARALLEL_MIN_ITEMS || !api::il2cpp_thread_detach) {
+        for (size_t i = 0; i < count; ++i) fn(i);
+        return;
+    }
+
+    std::atomic<size_t> next{ 0 };
+    auto worker = [&]() {
+        for (size_t i = next++; i < count; i = next++) fn(i);
+    };
+    auto attachedWorker = [&]() {
+        void* thread = api::il2cpp_thread_attach(api::il2cpp_domain_get());
+        worker();
+        if (thread) api::il2cpp_thread_detach(thread);
+    };
+
+    std::vector<std::thread> threads;
+    threads.reserve(workers - 1);
+    for (size_t t = 1; t < workers; ++t) threads.emplace_back(attachedWorker);
+    worker();
+    for (auto& th : threads) th.join();
+}
+
+// ============================================================================
+// Output Helpers
+// ============================================================================
+
+// Generated-code fragments shared by several generators
+static const char* const WRAPPER_BASE_CLASS = "Il2CppObject";                      // base of every class wrapper
+static const char* const EMPTY_TYPES_EXPR   = "global::System.Type.EmptyTypes";    // Type[] for no parameters
+static const char* const TYPE_ARRAY_OPEN    = "new global::System.Type[] { ";
+
+// Fixed text around the namespace name in every wrapper file's header. Kept as
+// string_views so each file appends them by length, with no strlen per file.
+static constexpr std::string_view FILE_HEADER_OPEN =
+    "// Auto-generated Il2Cpp wrapper classes\n"
+    "// Namespace: ";
+static constexpr std::string_view FILE_HEADER_CLOSE =
+    "\n"
+    "// Do not edit manually\n\n"
+    "#pragma warning disable 0108, 0114, 0162, 0168, 0219\n\n";
+
+/// Append each part to `out` in order. Parts are anything std::string::append
+/// takes whole: string literals, const char*, std::string, std::string_view.
+template <typename... Parts>
+static void Append(std::string& out, const Parts&... parts) {
+    (out.append(parts), ...);
+}
+
+/// Append items separated by `sep`; nothing for an empty list
+static void AppendJoined(std::string& out, const std::vector<std::string>& items, const char* sep) {
+    if (items.empty()) return;
+    out += items[0];
+    for (size_t i = 1; i < items.size(); ++i) Append(out, sep, items[i]);
+}
+
 // ============================================================================
 // IL2CPP Type-Name Helpers
 // ============================================================================
@@ -85,8 +197,8 @@ static bool _il2cpp_type_is_byref(const il2cppType* type) {
     return type->m_uByref != 0;
 }
 
-// Map IL2CPP primitive type enum to C# keyword
-static std::string PrimitiveTypeName(unsigned int typeEnum) {
+// Map IL2CPP primitive type enum to C# keyword (nullptr if not a primitive)
+static const char* PrimitiveTypeName(unsigned int typeEnum) {
     switch (typeEnum) {
     case IL2CPP_TYPE_VOID:      return "void";
     case IL2CPP_TYPE_BOOLEAN:   return "bool";
@@ -105,7 +217,7 @@ static std::string PrimitiveTypeName(unsigned int typeEnum) {
     case IL2CPP_TYPE_OBJECT:    return "object";
     case IL2CPP_TYPE_I:         return "IntPtr";
     case IL2CPP_TYPE_U:         return "UIntPtr";
-    default:                    return "";
+    default:                    return nullptr;
     }
 }
 
@@ -116,6 +228,17 @@ static std::string SanitizeTypeName(const std::string& name) {
     return (pos != std::string::npos) ? name.substr(0, pos) : name;
 }
 
+/// Parse the generic arity from an IL2CPP type name ("Dictionary`2" -> 2).
+/// Returns 0 when the name has no backtick and -1 when the suffix is not a number.
+static int ParseGenericArity(std::string_view name) {
+    auto pos = name.find('`');
+    if (pos == std::string_view::npos) return 0;
+
+    int arity = 0;
+    auto res = std::from_chars(name.data() + pos + 1, name.data() + name.size(), arity);
+    return res.ec == std::errc() ? arity : -1;
+}
+
 /// Walk the declaring type chain to find the effective namespace for nested types.
 /// In IL2CPP metadata, nested types (e.g. InputField.ContentType) have an empty namespace;
 /// the real namespace is on the outermost declaring type.
@@ -125,8 +248,7 @@ static std::string ResolveEffectiveNamespace(il2cppClass* klass) {
 
     // First check this class's own namespace
     const char* ns = api::il2cpp_class_get_namespace(klass);
-    std::string nsStr(ns ? ns : "");
-    if (!nsStr.empty()) return nsStr;
+    if (ns && ns[0]) return ns;
 
     // Empty namespace — check if this is a nested type by walking declaring type chain
     il2cppClass* declaring = nullptr;
@@ -144,8 +266,7 @@ static std::string ResolveEffectiveNamespace(il2cppClass* klass) {
         constexpr int MAX_DEPTH = 16; // safety limit
         for (int depth = 0; depth < MAX_DEPTH && declaring; ++depth) {
             const char* declNs = api::il2cpp_class_get_namespace(declaring);
-            std::string declNsStr(declNs ? declNs : "");
-            if (!declNsStr.empty()) return declNsStr;
+            if (declNs && declNs[0]) return declNs;
 
             // Keep walking up
             il2cppClass* next = nullptr;
@@ -162,57 +283,83 @@ static std::string ResolveEffectiveNamespace(il2cppClass* klass) {
     return "";
 }
 
+/// Generic instances that are erased to `object` (unavailable in .NET Framework
+/// 4.7.2, or not usable through Call<T>). Matched on namespace plus the name
+/// before the backtick, so one hash probe replaces a chain of prefix compares.
+static bool IsErasedGenericType(const std::string& ns, std::string_view baseName) {
+    static const std::unordered_map<std::string_view, std::unordered_set<std::string_view>> ERASED_GENERICS = {
+        { "System", { "Nullable", "Func", "Tuple", "ValueTuple",
+                      "Span", "ReadOnlySpan", "Memory", "ReadOnlyMemory" } },
+        { "System.Threading.Tasks", { "ValueTask" } },
+        { "Cysharp.Threading.Tasks", { "UniTask" } },
+        { "System.Runtime.CompilerServices", { "CallSite" } },
+    };
+
+    auto it = ERASED_GENERICS.find(ns);
+    return it != ERASED_GENERICS.end() && it->second.count(baseName) != 0;
+}
+
 // Forward declarations for mutual recursion
 static std::string GetFullyQualifiedTypeName(const il2cppType* type, const std::string& currentNamespace,
                                               const std::vector<std::string>* methodGenericParams = nullptr,
                                               uint32_t mvarBaseIndex = 0);
 static std::string GetFullyQualifiedClassName(il2cppClass* klass, const std::string& currentNamespace);
 
-/// Get the fully-qualified C# type name from an il2cppClass.
-/// If the type lives in `currentNamespace`, returns the short name.
-/// Otherwise, returns `global::Full.Namespace.TypeName`.
-/// Validates game types against g_knownTypes registry when populated.
-static std::string GetFullyQualifiedClassName(il2cppClass* klass, const std::string& currentNamespace) {
-    if (!klass) return "object";
+/// Per-class part of a class-name resolution. Everything except the final
+/// "short name vs. global::" choice is independent of the file being generated,
+/// so it is computed once per class and cached.
+struct ResolvedClassName {
+    std::string name;          // literal result when !qualify, else the (friendly) short name
+    std::string effectiveNs;   // namespace used to qualify `name` ("Global" for none)
+    std::string qualifiedName; // "global::<effectiveNs>.<name>", built once per class
+    bool qualify;              // false → primitives / erased types, returned as-is
+};
+
+// Bumped whenever g_knownTypes or g_mappingLookup change; drops stale cached resolutions.
+static uint32_t g_classNameGeneration = 0;
+
+static void InvalidateClassNameCache() {
+    ++g_classNameGeneration;
+}
+
+static ResolvedClassName ComputeClassName(il2cppClass* klass) {
+    ResolvedClassName r{ "object", std::string(), std::string(), false };
+    if (!klass) return r;
 
     const char* name = api::il2cpp_class_get_name(klass);
     const char* ns   = api::il2cpp_class_get_namespace(klass);
-    if (!name) return "object";
+    if (!name) return r;
 
     std::string nameStr(name);
     std::string nsStr(ns ? ns : "");
 
     // Check for primitives by well-known System class names
     if (nsStr == "System") {
-        if (nameStr == "Void")      return "void";
-        if (nameStr == "Boolean")   return "bool";
-        if (nameStr == "Char")      return "char";
-        if (nameStr == "SByte")     return "sbyte";
-        if (nameStr == "Byte")      return "byte";
-        if (nameStr == "Int16")     return "short";
-        if (nameStr == "UInt16")    return "ushort";
-        if (nameStr == "Int32")     return "int";
-        if (nameStr == "UInt32")    return "uint";
-        if (nameStr == "Int64")     return "long";
-        if (nameStr == "UInt64")    return "ulong";
-        if (nameStr == "Single")    return "float";
-        if (nameStr == "Double")    return "double";
-        if (nameStr == "String")    return "string";
-        if (nameStr == "Object")    return "object";
-        if (nameStr == "IntPtr")    return "IntPtr";
-        if (nameStr == "UIntPtr")   return "UIntPtr";
+        static const std::unordered_map<std::string_view, const char*> SYSTEM_KEYWORDS = {
+            { "Void",    "void" },   { "Boolean", "bool" },    { "Char",   "char" },
+            { "SByte",   "sbyte" },  { "Byte",    "byte" },    { "Int16",  "short" },
+            { "UInt16",  "ushort" }, { "Int32",   "int" },     { "UInt32", "uint" },
+            { "Int64",   "long" },   { "UInt64",  "ulong" },   { "Single", "float" },
+            { "Double",  "double" }, { "String",  "string" },  { "Object", "object" },
+            { "IntPtr",  "IntPtr" }, { "UIntPtr", "UIntPtr" },
+        };
+        auto kw = SYSTEM_KEYWORDS.find(nameStr);
+        if (kw != SYSTEM_KEYWORDS.end()) {
+            r.name = kw->second;
+            return r;
+        }
     }
 
     // Block types from namespaces not available in .NET Framework
-    if (IsBlockedNamespace(nsStr)) return "object";
+    if (IsBlockedNamespace(nsStr)) return r;
 
     // Sanitize generic backtick names for C# identifiers
     std::string safeName = SanitizeTypeName(nameStr);
 
     // Compiler-generated types (fixed buffers, display classes, state machines)
     // contain <> and are not valid C# identifiers - fall back to object
-    if (safeName.find('<') != std::string::npos || safeName.find('>') != std::string::npos) {
-        return "object";
+    if (safeName.find_first_of("<>") != std::string::npos) {
+        return r;
     }
 
     // Determine if this is a system/framework type or a game type
@@ -220,69 +367,95 @@ static std::string GetFullyQualifiedClassName(il2cppClass* klass, const std::str
 
     // Block specific system types not available in .NET Framework 4.7.2
     if (isSystemType) {
-        if (nsStr == "System.Threading.Tasks" && nameStr.rfind("ValueTask", 0) == 0) return "object";
-        if (nsStr == "System.Buffers" || nsStr == "System.Memory") return "object";
+        if (nsStr == "System.Threading.Tasks" && nameStr.rfind("ValueTask", 0) == 0) return r;
+        if (nsStr == "System.Buffers" || nsStr == "System.Memory") return r;
     }
 
     // For system types with generic arity, add <object, ...> since the real .NET type is generic
     if (isSystemType) {
-        auto backtickPos = nameStr.find('`');
-        if (backtickPos != std::string::npos) {
-            try {
-                int arity = std::stoi(nameStr.substr(backtickPos + 1));
-                if (arity > 0) {
-                    safeName += "<";
-                    for (int a = 0; a < arity; ++a) {
-                        if (a > 0) safeName += ", ";
-                        safeName += "object";
-                    }
-                    safeName += ">";
-                }
-            } catch (...) {}
+        int arity = ParseGenericArity(nameStr);
+        if (arity > 0) {
+            safeName += "<";
+            for (int a = 0; a < arity; ++a) {
+                if (a > 0) safeName += ", ";
+                safeName += "object";
+            }
+            safeName += ">";
         }
     }
 
     // Resolve the effective namespace (walks declaring type chain for nested types)
     std::string resolvedNs = nsStr.empty() ? ResolveEffectiveNamespace(klass) : nsStr;
-    std::string effectiveNs = resolvedNs.empty() ? "Global" : resolvedNs;
 
     // For game types, validate against known types registry
     if (!isSystemType && !g_knownTypes.empty()) {
-        std::string fqn = resolvedNs.empty() ? safeName : (resolvedNs + "." + safeName);
-        if (g_knownTypes.find(fqn) == g_knownTypes.end()) {
-            return "object";
+        if (!IsKnownType(resolvedNs, safeName)) {
+            return r;
         }
     }
 
     // Apply deobfuscation type name remapping (friendly display names)
     if (g_mappingLookup.HasMappings()) {
-        std::string friendly = g_mappingLookup.ResolveType(safeName);
+        const std::string& friendly = g_mappingLookup.ResolveType(safeName);
         if (!friendly.empty()) {
             safeName = friendly;
         }
     }
 
+    r.name = std::move(safeName);
+    r.effectiveNs = resolvedNs.empty() ? GLOBAL_NAMESPACE : std::move(resolvedNs);
+    r.qualifiedName.reserve(8 + r.effectiveNs.size() + 1 + r.name.size());
+    r.qualifiedName += "global::";
+    r.qualifiedName += r.effectiveNs;
+    r.qualifiedName += '.';
+    r.qualifiedName += r.name;
+    r.qualify = true;
+    return r;
+}
+
+/// Cached ComputeClassName. The cache is per thread so generator workers never
+/// contend on it; it is dropped whenever the generation counter moves.
+static const ResolvedClassName& ResolveClassName(il2cppClass* klass) {
+    thread_local std::unordered_map<il2cppClass*, ResolvedClassName> cache;
+    thread_local uint32_t cacheGeneration = 0;
+    if (cacheGeneration != g_classNameGeneration) {
+        cache.clear();
+        cacheGeneration = g_classNameGeneration;
+    }
+
+    auto it = cache.find(klass);
+    if (it != cache.end()) return it->second;
+    return cache.emplace(klass, ComputeClassName(klass)).first->second;
+}
+
+/// Get the fully-qualified C# type name from an il2cppClass.
+/// If the type lives in `currentNamespace`, returns the short name.
+/// Otherwise, returns `global::Full.Namespace.TypeName`.
+/// Validates game types against g_knownTypes registry when populated.
+static std::string GetFullyQualifiedClassName(il2cppClass* klass, const std::string& currentNamespace) {
+    if (!klass) return "object";
+
+    const ResolvedClassName& r = ResolveClassName(klass);
+    if (!r.qualify) return r.name;
+
     // For types whose namespace matches the file we're generating, use short name
-    if (effectiveNs == currentNamespace) {
-        return safeName;
+    if (r.effectiveNs == currentNamespace) {
+        return r.name;
     }
 
     // Fully qualify with global:: prefix
-    return "global::" + effectiveNs + "." + safeName;
+    return r.qualifiedName;
 }
 
-/// Get the fully-qualified C# type name from an il2cppType.
-/// When methodGenericParams is non-null, IL2CPP_TYPE_MVAR types are resolved to
-/// the named type parameters (T, T0, T1, …) instead of being erased to "object".
-/// mvarBaseIndex is the global generic-parameter index of the method's first type param.
-static std::string GetFullyQualifiedTypeName(const il2cppType* type, const std::string& currentNamespace,
-                                              const std::vector<std::string>* methodGenericParams,
-                                              uint32_t mvarBaseIndex) {
+/// Uncached body of GetFullyQualifiedTypeName. Nested type arguments and array
+/// elements recurse through GetFullyQualifiedTypeName so they hit the cache too.
+static std::string ComputeTypeName(const il2cppType* type, const std::string& currentNamespace,
+                                   const std::vector<std::string>* methodGenericParams,
+                                   uint32_t mvarBaseIndex) {
     if (!type) return "object";
 
     // Check for primitive types by IL2CPP type enum
-    std::string prim = PrimitiveTypeName(type->m_uType);
-    if (!prim.empty()) return prim;
+    if (const char* prim = PrimitiveTypeName(type->m_uType)) return prim;
 
     // Method-level generic type parameters (MVAR) — resolve to T / T0 / T1 / … when available
     if (type->m_uType == IL2CPP_TYPE_MVAR) {
@@ -327,28 +500,14 @@ static std::string GetFullyQualifiedTypeName(const il2cppType* type, const std::
         std::string nameStr(name ? name : "");
         std::string nsStr(ns ? ns : "");
 
+        // Name without the `N arity suffix, sliced once and shared by the checks below
+        std::string_view baseView(nameStr);
+        baseView = baseView.substr(0, baseView.find('`'));
+
         // --- Special cases: types that should be erased entirely ---
-        if (nsStr == "System") {
-            if (nameStr.rfind("Nullable`1", 0) == 0) return "object";
-            if (nameStr.rfind("Func`", 0) == 0) return "object";
-            if (nameStr.rfind("Tuple`", 0) == 0) return "object";
-            if (nameStr.rfind("ValueTuple`", 0) == 0) return "object";
-            if (nameStr.rfind("Span`1", 0) == 0) return "object";
-            if (nameStr.rfind("ReadOnlySpan`1", 0) == 0) return "object";
-            if (nameStr.rfind("Memory`1", 0) == 0) return "object";
-            if (nameStr.rfind("ReadOnlyMemory`1", 0) == 0) return "object";
-        }
-        if (nsStr == "System.Threading.Tasks") {
-            if (nameStr.rfind("ValueTask`1", 0) == 0) return "object";
-        }
-        if (nsStr == "Cysharp.Threading.Tasks") {
-            if (nameStr.rfind("UniTask`1", 0) == 0) return "object";
-        }
+        if (IsErasedGenericType(nsStr, baseView)) return "object";
         // Types from namespaces blocked or unavailable in .NET Framework 4.7.2
         if (IsBlockedNamespace(nsStr)) return "object";
-        if (nsStr == "System.Runtime.CompilerServices") {
-            if (nameStr.rfind("CallSite`", 0) == 0) return "object";
-        }
 
         // --- Try to resolve actual generic type arguments ---
         std::vector<std::string> typeArgs;
@@ -374,14 +533,11 @@ static std::string GetFullyQualifiedTypeName(const il2cppType* type, const std::
 
         // If we couldn't resolve the args, fall back to object-erased form
         if (!resolvedArgs) {
-            auto backtickPos = nameStr.find('`');
-            if (backtickPos != std::string::npos) {
-                try {
-                    int arity = std::stoi(nameStr.substr(backtickPos + 1));
-                    for (int a = 0; a < arity; ++a) typeArgs.push_back("object");
-                } catch (...) {
-                    typeArgs.push_back("object");
-                }
+            int arity = ParseGenericArity(nameStr);
+            if (arity < 0) {
+                typeArgs.push_back("object");
+            } else {
+                typeArgs.assign(arity, "object");
             }
         }
 
@@ -395,11 +551,8 @@ static std::string GetFullyQualifiedTypeName(const il2cppType* type, const std::
         bool isSystemType = ShouldSkipNamespace(nsStr);
         std::string baseName;
         if (isSystemType) {
-            baseName = SanitizeTypeName(nameStr);
-            // For Action`N with resolved args, use Action<...> form
-            if (nsStr == "System" && nameStr.rfind("Action`", 0) == 0) {
-                baseName = "Action";
-            }
+            // For Action`N with resolved args this is already the Action<...> form
+            baseName = baseView;
         } else {
             // Game types: our wrappers are emitted WITHOUT generic type parameters
             // (we erase T→object in class definitions), so we cannot reference them
@@ -414,10 +567,7 @@ static std::string GetFullyQualifiedTypeName(const il2cppType* type, const std::
         }
 
         baseName += "<";
-        for (size_t i = 0; i < typeArgs.size(); ++i) {
-            if (i > 0) baseName += ", ";
-            baseName += typeArgs[i];
-        }
+        AppendJoined(baseName, typeArgs, ", ");
         baseName += ">";
 
         return baseName;
@@ -430,44 +580,106 @@ static std::string GetFullyQualifiedTypeName(const il2cppType* type, const std::
     return GetFullyQualifiedClassName(klass, currentNamespace);
 }
 
+/// Get the fully-qualified C# type name from an il2cppType.
+/// When methodGenericParams is non-null, IL2CPP_TYPE_MVAR types are resolved to
+/// the named type parameters (T, T0, T1, …) instead of being erased to "object".
+/// mvarBaseIndex is the global generic-parameter index of the method's first type param.
+///
+/// Without method type parameters the result depends only on (type, namespace),
+/// and the same field/parameter types recur across a whole namespace file, so
+/// those resolutions are cached per thread. A Phase 2 worker generates one
+/// namespace at a time; the cache is dropped when the namespace or the
+/// class-name generation changes.
+static std::string GetFullyQualifiedTypeName(const il2cppType* type, const std::string& currentNamespace,
+                                              const std::vector<std::string>* methodGenericParams,
+                                              uint32_t mvarBaseIndex) {
+    if (!type) return "object";
+    if (methodGenericParams && !methodGenericParams->empty()) {
+        return ComputeTypeName(type, currentNamespace, methodGenericParams, mvarBaseIndex);
+    }
+
+    thread_local std::unordered_map<const il2cppType*, std::string> cache;
+    thread_local std::string cacheNamespace;
+    thread_local uint32_t cacheGeneration = 0;
+    if (cacheGeneration != g_classNameGeneration || cacheNamespace != currentNamespace) {
+        cache.clear();
+        cacheNamespace = currentNamespace;
+        cacheGeneration = g_classNameGeneration;
+    }
+
+    auto it = cache.find(type);
+    if (it != cache.end()) return it->second;
+    std::string name = ComputeTypeName(type, currentNamespace, nullptr, 0);
+    cache.emplace(type, name);
+    return name;
+}
+
+/// True if the type refers to an IL2CPP interface. Only class and generic-instance
+/// types can be interfaces, so primitives, arrays and generic parameters skip the
+/// class lookup entirely.
+static bool IsInterfaceType(const il2cppType* type) {
+    if (!type) return false;
+    if (type->m_uType != IL2CPP_TYPE_CLASS && type->m_uType != IL2CPP_TYPE_GENERICINST) return false;
+    auto klass = api::il2cpp_class_from_type(type);
+    return klass && (api::il2cpp_class_get_flags(klass) & TYPE_ATTRIBUTE_INTERFACE);
+}
+
+/// Type name for a wrapper member signature (return / property type).
+/// Interface types become Il2CppObject: C# can't instantiate interfaces, so
+/// Call<IFoo> would return null. Users can call .As<ConcreteType>() to re-wrap.
+static std::string GetWrapperTypeName(const il2cppType* type, const std::string& currentNamespace,
+                                      const std::vector<std::string>* methodGenericParams = nullptr,
+                                      uint32_t mvarBaseIndex = 0) {
+    if (IsInterfaceType(type)) return WRAPPER_BASE_CLASS;
+    return GetFullyQualifiedTypeName(type, currentNamespace, methodGenericParams, mvarBaseIndex);
+}
+
 // ============================================================================
 // Type Classification Helpers
 // ============================================================================
 
+// Declaration order is also the emission order within a namespace file
 enum class TypeKind { Delegate, Enum, Interface, Struct, Class };
+static constexpr size_t TYPE_KIND_COUNT = 5;
 
+// One entry per emitted type; a dump holds tens of thousands of these, so only
+// state that Phase 2 actually reads is kept (flag bits are decoded in ClassifyType).
 struct ClassInfo {
     il2cppClass* klass;
     std::string name;          // display name (friendly if mapped, else sanitized)
     std::string rawName;       // raw IL2CPP name (unsanitized, always obfuscated)
     std::string ns;            // effective namespace (empty→"Global")
     std::string rawNs;         // raw IL2CPP namespace (may be empty)
-    std::string dll;
-    int flags;
-    bool is_valuetype;
-    bool is_enum;
-    bool is_interface;
+    std::string base_class;    // fully qualified base class for wrappers
+    il2cppClass* parent;       // wrappable parent class (nullptr → Il2CppObject)
+    const char* visibility;    // shared literal from GetVisibility()
     TypeKind kind;
-    std::string visibility;
-    bool is_abstract;
-    bool is_sealed;
     bool is_static;
-    std::string base_class;    // fully qualified base class for wrappers
+    bool is_deobfuscated;      // a mappings.json entry exists for `rawName` (set in Phase 1.6)
 };
 
-static std::string GetVisibility(int flags) {
+// Visibility keywords and parameter modifiers are emitted for every type, member
+// and parameter — hand out shared literals instead of allocating a std::string each time.
+static const char* const VIS_PUBLIC    = "public";
+
+static const char* const REF_KIND_NONE = "";
+static const char* const REF_KIND_OUT  = "out ";
+static const char* const REF_KIND_IN   = "in ";
+static const char* const REF_KIND_REF  = "ref ";
+
+static const char* GetVisibility(int flags) {
     (void)flags;
-    return "public";
+    return VIS_PUBLIC;
 }
 
-static std::string GetMethodVisibility(uint32_t flags) {
+static const char* GetMethodVisibility(uint32_t flags) {
     (void)flags;
-    return "public";
+    return VIS_PUBLIC;
 }
 
-static std::string GetFieldVisibility(uint32_t attrs) {
+static const char* GetFieldVisibility(uint32_t attrs) {
     (void)attrs;
-    return "public";
+    return VIS_PUBLIC;
 }
 
 /// Check if a class is a delegate (parent is System.MulticastDelegate)
@@ -477,12 +689,29 @@ static bool IsDelegate(il2cppClass* klass) {
     const char* parentName = api::il2cpp_class_get_name(parent);
     const char* parentNs   = api::il2cpp_class_get_namespace(parent);
     if (!parentName || !parentNs) return false;
-    return (std::string(parentNs) == "System" &&
-            (std::string(parentName) == "MulticastDelegate" || std::string(parentName) == "Delegate"));
+    return std::strcmp(parentNs, "System") == 0 &&
+           (std::strcmp(parentName, "MulticastDelegate") == 0 || std::strcmp(parentName, "Delegate") == 0);
+}
+
+/// Parent class a class wrapper can derive from, or nullptr to fall back to
+/// Il2CppObject. Exits are ordered by how often they hit: no parent or a plain
+/// System.Object parent, then global game types, then framework namespaces.
+/// The synthetic System bases (ValueType, Enum, (Multicast)Delegate) live in
+/// "System", so the namespace check rejects them along with every other type
+/// that has no IL2CPP wrapper IntPtr constructor.
+static il2cppClass* WrappableParent(il2cppClass* klass) {
+    auto* parent = api::il2cpp_class_get_parent(klass);
+    if (!parent) return nullptr;
+    auto parentType = api::il2cpp_class_get_type(parent);
+    if (!parentType || parentType->m_uType == IL2CPP_TYPE_OBJECT) return nullptr;
+
+    const char* parentNs = api::il2cpp_class_get_namespace(parent);
+    if (!parentNs || parentNs[0] == '\0') return parent;
+    return ShouldSkipNamespace(parentNs) ? nullptr : parent;
 }
 
 /// Classify a type and fill in ClassInfo
-static ClassInfo ClassifyType(il2cppClass* klass, const std::string& dllName, const std::string& effectiveNamespace) {
+static ClassInfo ClassifyType(il2cppClass* klass, const std::string& effectiveNamespace) {
     ClassInfo info{};
     info.klass = klass;
     const char* rawClassName = api::il2cpp_class_get_name(klass);
@@ -491,69 +720,116 @@ static ClassInfo ClassifyType(il2cppClass* klass, const std::string& dllName, co
     const char* rawNs = api::il2cpp_class_get_namespace(klass);
     info.rawNs = rawNs ? rawNs : "";
     info.ns = effectiveNamespace;
-    info.dll = dllName;
-    info.flags = api::il2cpp_class_get_flags(klass);
-    info.is_valuetype = api::il2cpp_class_is_valuetype(klass);
-    info.is_enum = api::il2cpp_class_is_enum(klass);
-    info.is_interface = (info.flags & TYPE_ATTRIBUTE_INTERFACE) != 0;
-    info.is_abstract = (info.flags & TYPE_ATTRIBUTE_ABSTRACT) != 0;
-    info.is_sealed = (info.flags & TYPE_ATTRIBUTE_SEALED) != 0;
-    info.is_static = info.is_abstract && info.is_sealed;
-    info.visibility = GetVisibility(info.flags);
+
+    int flags = api::il2cpp_class_get_flags(klass);
+    bool isAbstract = (flags & TYPE_ATTRIBUTE_ABSTRACT) != 0;
+    bool isSealed = (flags & TYPE_ATTRIBUTE_SEALED) != 0;
+    info.is_static = isAbstract && isSealed;
+    info.visibility = GetVisibility(flags);
 
     // Determine kind
     if (IsDelegate(klass)) {
         info.kind = TypeKind::Delegate;
-    } else if (info.is_enum) {
+    } else if (api::il2cpp_class_is_enum(klass)) {
         info.kind = TypeKind::Enum;
-    } else if (info.is_interface) {
+    } else if (flags & TYPE_ATTRIBUTE_INTERFACE) {
         info.kind = TypeKind::Interface;
-    } else if (info.is_valuetype) {
+    } else if (api::il2cpp_class_is_valuetype(klass)) {
         info.kind = TypeKind::Struct;
     } else {
         info.kind = TypeKind::Class;
     }
 
-    // Determine base class for class wrappers
+    // Record the parent for class wrappers. Its C# name is resolved once, after the
+    // known-types registry and name mappings are in place (see ResolveBaseClasses).
     if (info.kind == TypeKind::Class) {
-        auto* parent = api::il2cpp_class_get_parent(klass);
-        if (parent) {
-            auto parentType = api::il2cpp_class_get_type(parent);
-            if (parentType && parentType->m_uType != IL2CPP_TYPE_OBJECT) {
-                const char* parentName = api::il2cpp_class_get_name(parent);
-                const char* parentNs = api::il2cpp_class_get_namespace(parent);
-                std::string pName(parentName ? parentName : "");
-                std::string pNs(parentNs ? parentNs : "");
-
-                // Skip synthetic base types
-                if (pNs == "System" && (pName == "ValueType" || pName == "Enum" ||
-                    pName == "MulticastDelegate" || pName == "Delegate")) {
-                    info.base_class = "";
-                } else if (ShouldSkipNamespace(pNs)) {
-                    // System/framework types don't have IL2CPP wrapper IntPtr constructors
-                    info.base_class = "";
-                } else {
-                    info.base_class = GetFullyQualifiedClassName(parent, effectiveNamespace);
-                }
-            }
-        }
+        info.parent = WrappableParent(klass);
 
         // Default base: Il2CppObject
-        if (info.base_class.empty()) {
-            info.base_class = "Il2CppObject";
-        }
+        info.base_class = WRAPPER_BASE_CLASS;
     }
 
     return info;
 }
 
+/// Resolve each class wrapper's base class to its final C# name.
+/// Must run after g_knownTypes and g_mappingLookup are populated so unknown
+/// parents fall back to Il2CppObject and mapped parents use friendly names.
+static void ResolveBaseClasses(std::map<std::string, std::vector<ClassInfo>>& typesByNamespace) {
+    for (auto& [ns, types] : typesByNamespace) {
+        for (auto& info : types) {
+            if (info.kind != TypeKind::Class || !info.parent) continue;
+
+            // Work on the cached per-class resolution directly: siblings share a
+            // parent, so after the first one this is a single cache hit, and
+            // rejected parents (erased to object / unknown) exit before any
+            // string is built.
+            const ResolvedClassName& r = ResolveClassName(info.parent);
+            if (!r.qualify || r.name.empty()) continue;
+
+            // Detect circular base type (e.g., FancyScrollView<T,U> extends FancyScrollView<T>)
+            std::string_view tail(r.name);
+            auto lastDot = tail.rfind('.');
+            if (lastDot != std::string_view::npos) tail.remove_prefix(lastDot + 1);
+            if (tail == info.name) continue;
+
+            info.base_class = (r.effectiveNs == info.ns) ? r.name : r.qualifiedName;
+        }
+    }
+}
+
+/// Classify every wrappable type in one image, appending to `out`.
+/// Returns the image's total class count (for dump statistics).
+/// Safe to call concurrently for different images: it only reads IL2CPP
+/// metadata and the (already-built) obfuscation detector.
+static size_t CollectAssemblyTypes(const il2cppImage* image, std::vector<ClassInfo>& out) {
+    auto classCount = api::il2cpp_image_get_class_count(image);
+
+    for (size_t j = 0; j < classCount; ++j) {
+        auto klass = api::il2cpp_image_get_class(image, j);
+        if (!klass) continue;
+
+        const char* ns = api::il2cpp_class_get_namespace(klass);
+        const char* name = api::il2cpp_class_get_name(klass);
+        if (!name) continue;
+
+        // Skip compiler-generated types — one scan of the raw name, before
+        // anything is copied for the (majority of) rejected entries
+        if (std::strpbrk(name, "<>/")) continue;
+
+        std::string nsStr(ns ? ns : "");
+
+        // Skip system/internal namespaces (check raw namespace first)
+        if (ShouldSkipNamespace(nsStr)) continue;
+
+        // Skip non-public types
+        int flags = api::il2cpp_class_get_flags(klass);
+        auto vis = flags & TYPE_ATTRIBUTE_VISIBILITY_MASK;
+        if (vis != TYPE_ATTRIBUTE_PUBLIC && vis != TYPE_ATTRIBUTE_NESTED_PUBLIC) continue;
+
+        // Obfuscation filter: skip entirely-fake classes
+        if (g_obfuscation_detector && g_obfuscation_detector->IsEntirelyFakeClass(klass)) continue;
+
+        // Resolve effective namespace: nested types inherit their declaring type's namespace
+        std::string resolvedNs = nsStr.empty() ? ResolveEffectiveNamespace(klass) : nsStr;
+
+        // Re-check the resolved namespace — nested types from System/Mono/etc. must also be skipped
+        if (resolvedNs != nsStr && ShouldSkipNamespace(resolvedNs)) continue;
+
+        std::string bucketNs = resolvedNs.empty() ? GLOBAL_NAMESPACE : resolvedNs;
+
+        out.push_back(ClassifyType(klass, bucketNs));
+    }
+
+    return classCount;
+}
+
 // ============================================================================
 // Delegate Generation
 // ============================================================================
 
-static std::string GenerateDelegate(il2cppClass* klass, const std::string& currentNamespace,
-                                    const std::string& obfTypeName) {
-    std::stringstream ss;
+static void GenerateDelegate(const ClassInfo& info, const std::string& currentNamespace, std::string& out) {
+    il2cppClass* klass = info.klass;
 
     // Find the "Invoke" method for the delegate signature
     void* iter = nullptr;
@@ -565,71 +841,51 @@ static std::string GenerateDelegate(il2cppClass* klass, const std::string& curre
         }
     }
 
-    std::string vis = GetVisibility(api::il2cpp_class_get_flags(klass));
-    std::string delegateName = SanitizeTypeName(api::il2cpp_class_get_name(klass) ? api::il2cpp_class_get_name(klass) : "");
-
-    // Resolve display name from mappings
-    bool isDeobfuscated = false;
-    if (g_mappingLookup.HasMappings()) {
-        std::string friendly = g_mappingLookup.ResolveType(obfTypeName);
-        if (!friendly.empty()) {
-            delegateName = friendly;
-            isDeobfuscated = true;
-        }
-    }
+    const char* vis = info.visibility;
+    const std::string& delegateName = info.name;
 
-    if (isDeobfuscated) {
-        ss << "    /// <summary>Deobfuscated delegate. IL2CPP name: '" << obfTypeName << "'</summary>\n";
+    if (info.is_deobfuscated) {
+        Append(out, "    /// <summary>Deobfuscated delegate. IL2CPP name: '", info.rawName, "'</summary>\n");
     }
 
     if (!invokeMethod) {
         // Fallback
-        ss << "    " << vis << " delegate void " << delegateName << "();\n";
-        return ss.str();
+        Append(out, "    ", vis, " delegate void ", delegateName, "();\n");
+        return;
     }
 
     auto returnType = api::il2cpp_method_get_return_type(invokeMethod);
     std::string returnTypeName = GetFullyQualifiedTypeName(returnType, currentNamespace);
 
-    ss << "    " << vis << " delegate " << returnTypeName << " " << delegateName << "(";
+    Append(out, "    ", vis, " delegate ", returnTypeName, " ", delegateName, "(");
 
     auto paramCount = api::il2cpp_method_get_param_count(invokeMethod);
+    const char* sep = "";
     for (uint32_t i = 0; i < paramCount; ++i) {
-        if (i > 0) ss << ", ";
         auto param = api::il2cpp_method_get_param(invokeMethod, i);
         std::string paramTypeName = GetFullyQualifiedTypeName(param, currentNamespace);
         const char* paramName = api::il2cpp_method_get_param_name(invokeMethod, i);
-        ss << paramTypeName << " " << ((paramName && paramName[0] != '\0') ? paramName : ("arg" + std::to_string(i)));
+        Append(out, sep, paramTypeName, " ", ((paramName && paramName[0] != '\0') ? paramName : ("arg" + std::to_string(i))));
+        sep = ", ";
     }
 
-    ss << ");\n";
-    return ss.str();
+    out += ");\n";
 }
 
 // ============================================================================
 // Enum Generation
 // ============================================================================
 
-static std::string GenerateEnum(il2cppClass* klass, const std::string& obfTypeName) {
-    std::stringstream ss;
+static void GenerateEnum(const ClassInfo& info, std::string& out) {
+    il2cppClass* klass = info.klass;
 
-    std::string vis = GetVisibility(api::il2cpp_class_get_flags(klass));
+    const char* vis = info.visibility;
+    const std::string& displayName = info.name;
 
-    // Resolve display name from mappings
-    std::string displayName = SanitizeTypeName(api::il2cpp_class_get_name(klass));
-    bool isDeobfuscated = false;
-    if (g_mappingLookup.HasMappings()) {
-        std::string friendly = g_mappingLookup.ResolveType(obfTypeName);
-        if (!friendly.empty()) {
-            displayName = friendly;
-            isDeobfuscated = true;
-        }
+    if (info.is_deobfuscated) {
+        Append(out, "    /// <summary>Deobfuscated enum. IL2CPP name: '", info.rawName, "'</summary>\n");
     }
-
-    if (isDeobfuscated) {
-        ss << "    /// <summary>Deobfuscated enum. IL2CPP name: '" << obfTypeName << "'</summary>\n";
-    }
-    ss << "    " << vis << " enum " << displayName;
+    Append(out, "    ", vis, " enum ", displayName);
 
     // Detect enum backing type from value__ field
     void* btIter = nullptr;
@@ -637,18 +893,18 @@ static std::string GenerateEnum(il2cppClass* klass, const std::string& obfTypeNa
     bool isUnsigned = false;
     while (auto btField = api::il2cpp_class_get_fields(klass, &btIter)) {
         const char* fn = api::il2cpp_field_get_name(btField);
-        if (fn && std::string(fn) == "value__") {
+        if (fn && std::strcmp(fn, "value__") == 0) {
             auto ftype = api::il2cpp_field_get_type(btField);
             if (ftype) {
                 backingTypeEnum = ftype->m_uType;
                 switch (backingTypeEnum) {
-                case IL2CPP_TYPE_U4: ss << " : uint"; isUnsigned = true; break;
-                case IL2CPP_TYPE_I8: ss << " : long"; break;
-                case IL2CPP_TYPE_U8: ss << " : ulong"; isUnsigned = true; break;
-                case IL2CPP_TYPE_I2: ss << " : short"; break;
-                case IL2CPP_TYPE_U2: ss << " : ushort"; isUnsigned = true; break;
-                case IL2CPP_TYPE_I1: ss << " : sbyte"; break;
-                case IL2CPP_TYPE_U1: ss << " : byte"; isUnsigned = true; break;
+                case IL2CPP_TYPE_U4: out += " : uint"; isUnsigned = true; break;
+                case IL2CPP_TYPE_I8: out += " : long"; break;
+                case IL2CPP_TYPE_U8: out += " : ulong"; isUnsigned = true; break;
+                case IL2CPP_TYPE_I2: out += " : short"; break;
+                case IL2CPP_TYPE_U2: out += " : ushort"; isUnsigned = true; break;
+                case IL2CPP_TYPE_I1: out += " : sbyte"; break;
+                case IL2CPP_TYPE_U1: out += " : byte"; isUnsigned = true; break;
                 default: break; // int is default
                 }
             }
@@ -656,22 +912,25 @@ static std::string GenerateEnum(il2cppClass* klass, const std::string& obfTypeNa
         }
     }
 
-    ss << "\n    {\n";
+    out += "\n    {\n";
 
+    // Members are separated by ",\n"; the separator is swapped in after the first
     void* iter = nullptr;
-    bool first = true;
+    const char* sep = "";
     while (auto field = api::il2cpp_class_get_fields(klass, &iter)) {
         auto attrs = api::il2cpp_field_get_flags(field);
         if (!(attrs & FIELD_ATTRIBUTE_LITERAL)) continue;
 
-        if (!first) ss << ",\n";
-        first = false;
-
         uint64_t val = 0;
         api::il2cpp_field_static_get_value(field, &val);
-        ss << "        " << api::il2cpp_field_get_name(field) << " = ";
+        Append(out, sep, "        ", api::il2cpp_field_get_name(field), " = ");
+        sep = ",\n";
+
+        // Format the raw value straight into the buffer (no temporary string per member)
+        char digits[24];
+        std::to_chars_result res;
         if (isUnsigned) {
-            ss << std::dec << val;
+            res = std::to_chars(digits, digits + sizeof(digits), val);
         } else {
             // Sign-extend based on backing type width
             int64_t signedVal;
@@ -681,69 +940,46 @@ static std::string GenerateEnum(il2cppClass* klass, const std::string& obfTypeNa
             case IL2CPP_TYPE_I8: signedVal = (int64_t)val; break;
             default: signedVal = (int64_t)(int32_t)(val & 0xFFFFFFFF); break;
             }
-            ss << std::dec << signedVal;
+            res = std::to_chars(digits, digits + sizeof(digits), signedVal);
         }
+        out.append(digits, res.ptr);
     }
 
-    if (!first) ss << "\n";
-    ss << "    }\n";
-    return ss.str();
+    out += (*sep ? "\n    }\n" : "    }\n");
 }
 
 // ============================================================================
 // Interface Generation (Stub)
 // ============================================================================
 
-static std::string GenerateInterface(il2cppClass* klass, const std::string& obfTypeName) {
-    std::stringstream ss;
-    std::string vis = GetVisibility(api::il2cpp_class_get_flags(klass));
-
-    // Resolve display name from mappings
-    std::string displayName = SanitizeTypeName(api::il2cpp_class_get_name(klass));
-    bool isDeobfuscated = false;
-    if (g_mappingLookup.HasMappings()) {
-        std::string friendly = g_mappingLookup.ResolveType(obfTypeName);
-        if (!friendly.empty()) {
-            displayName = friendly;
-            isDeobfuscated = true;
-        }
-    }
+static void GenerateInterface(const ClassInfo& info, std::string& out) {
+    const char* vis = info.visibility;
+    const std::string& displayName = info.name;
 
-    if (isDeobfuscated) {
-        ss << "    /// <summary>Deobfuscated interface. IL2CPP name: '" << obfTypeName << "'</summary>\n";
+    if (info.is_deobfuscated) {
+        Append(out, "    /// <summary>Deobfuscated interface. IL2CPP name: '", info.rawName, "'</summary>\n");
     }
-    ss << "    " << vis << " interface " << displayName << "\n";
-    ss << "    {\n";
-    ss << "        // Stub interface\n";
-    ss << "    }\n";
-    return ss.str();
+    Append(out, "    ", vis, " interface ", displayName, "\n"
+                "    {\n"
+                "        // Stub interface\n"
+                "    }\n");
 }
 
 // ============================================================================
 // Struct Generation
 // ============================================================================
 
-static std::string GenerateStruct(il2cppClass* klass, const std::string& currentNamespace,
-                                  const std::string& obfTypeName) {
-    std::stringstream ss;
-    std::string vis = GetVisibility(api::il2cpp_class_get_flags(klass));
-
-    // Resolve display name from mappings
-    std::string displayName = SanitizeTypeName(api::il2cpp_class_get_name(klass));
-    bool isDeobfuscated = false;
-    if (g_mappingLookup.HasMappings()) {
-        std::string friendly = g_mappingLookup.ResolveType(obfTypeName);
-        if (!friendly.empty()) {
-            displayName = friendly;
-            isDeobfuscated = true;
-        }
-    }
+static void GenerateStruct(const ClassInfo& info, const std::string& currentNamespace, std::string& out) {
+    il2cppClass* klass = info.klass;
+    const std::string& obfTypeName = info.rawName;
+    const char* vis = info.visibility;
+    const std::string& displayName = info.name;
 
-    if (isDeobfuscated) {
-        ss << "    /// <summary>Deobfuscated struct. IL2CPP name: '" << obfTypeName << "'</summary>\n";
+    if (info.is_deobfuscated) {
+        Append(out, "    /// <summary>Deobfuscated struct. IL2CPP name: '", info.rawName, "'</summary>\n");
     }
-    ss << "    " << vis << " struct " << displayName << "\n";
-    ss << "    {\n";
+    Append(out, "    ", vis, " struct ", displayName, "\n"
+                "    {\n");
 
     bool hasFields = false;
     void* iter = nullptr;
@@ -761,29 +997,28 @@ static std::string GenerateStruct(il2cppClass* klass, const std::string& current
         // Skip compiler-generated backing fields
         if (fieldName[0] == '<') continue;
         // Skip fields whose type is compiler-generated (e.g. <buffer>e__FixedBuffer)
-        if (fieldTypeName.find('<') != std::string::npos || fieldTypeName.find('>') != std::string::npos) continue;
+        if (fieldTypeName.find_first_of("<>") != std::string::npos) continue;
 
         // Resolve field display name from mappings
         std::string fieldNameStr(fieldName);
         std::string displayFieldName = fieldNameStr;
         if (g_mappingLookup.HasMappings()) {
-            std::string ff = g_mappingLookup.ResolveMember(obfTypeName, fieldNameStr);
+            const std::string& ff = g_mappingLookup.ResolveMember(obfTypeName, fieldNameStr);
             if (!ff.empty()) {
-                ss << "        /// <summary>Deobfuscated field. IL2CPP name: '" << fieldNameStr << "'</summary>\n";
+                Append(out, "        /// <summary>Deobfuscated field. IL2CPP name: '", fieldNameStr, "'</summary>\n");
                 displayFieldName = ff;
             }
         }
 
-        ss << "        public " << fieldTypeName << " " << displayFieldName << ";\n";
+        Append(out, "        public ", fieldTypeName, " ", displayFieldName, ";\n");
         hasFields = true;
     }
 
     if (!hasFields) {
-        ss << "        // Stub struct\n";
+        out += "        // Stub struct\n";
     }
 
-    ss << "    }\n";
-    return ss.str();
+    out += "    }\n";
 }
 
 // ============================================================================
@@ -791,9 +1026,8 @@ static std::string GenerateStruct(il2cppClass* klass, const std::string& current
 // ============================================================================
 
 /// Generate the field-as-property wrappers for a class
-static std::string GenerateClassFields(il2cppClass* klass, const std::string& currentNamespace,
-                                       const std::string& obfClassName) {
-    std::stringstream ss;
+static void GenerateClassFields(il2cppClass* klass, const std::string& currentNamespace,
+                                const std::string& obfClassName, std::string& out) {
     bool hasFields = false;
     std::set<std::string> emittedFieldNames;
 
@@ -818,7 +1052,7 @@ static std::string GenerateClassFields(il2cppClass* klass, const std::string& cu
         std::string displayFieldName = fieldNameStr;
         bool fieldIsDeobfuscated = false;
         if (g_mappingLookup.HasMappings()) {
-            std::string friendly = g_mappingLookup.ResolveMember(obfClassName, fieldNameStr);
+            const std::string& friendly = g_mappingLookup.ResolveMember(obfClassName, fieldNameStr);
             if (!friendly.empty()) {
                 displayFieldName = friendly;
                 fieldIsDeobfuscated = true;
@@ -828,54 +1062,45 @@ static std::string GenerateClassFields(il2cppClass* klass, const std::string& cu
         // Skip duplicate field names (using display name for C# compilation)
         if (!emittedFieldNames.insert(displayFieldName).second) continue;
 
-        std::string vis = GetFieldVisibility(attrs);
+        const char* vis = GetFieldVisibility(attrs);
         auto fieldType = api::il2cpp_field_get_type(field);
         std::string typeName = GetFullyQualifiedTypeName(fieldType, currentNamespace);
         // Skip fields whose type is compiler-generated (e.g. <buffer>e__FixedBuffer)
-        if (typeName.find('<') != std::string::npos || typeName.find('>') != std::string::npos) continue;
+        if (typeName.find_first_of("<>") != std::string::npos) continue;
 
         // If the field type is an IL2CPP interface, use Il2CppObject instead.
         // C# can't instantiate interfaces, so GetField<InterfaceType> would return null.
         // Users can call .As<ConcreteType>() to re-wrap the result.
-        {
-            auto fieldClass = api::il2cpp_class_from_type(fieldType);
-            if (fieldClass) {
-                auto classFlags = api::il2cpp_class_get_flags(fieldClass);
-                if (classFlags & TYPE_ATTRIBUTE_INTERFACE) {
-                    typeName = "Il2CppObject";
-                }
-            }
+        if (IsInterfaceType(fieldType)) {
+            typeName = WRAPPER_BASE_CLASS;
         }
 
         if (!hasFields) {
-            ss << "\n        // Fields\n";
+            out += "\n        // Fields\n";
             hasFields = true;
         }
 
         if (fieldIsDeobfuscated) {
-            ss << "        /// <summary>Deobfuscated field. IL2CPP name: '" << fieldNameStr << "'</summary>\n";
+            Append(out, "        /// <summary>Deobfuscated field. IL2CPP name: '", fieldNameStr, "'</summary>\n");
         }
-        ss << "        " << vis << " " << typeName << " " << displayFieldName << "\n";
-        ss << "        {\n";
-        ss << "            get => Il2CppRuntime.GetField<" << typeName << ">(this, \"" << fieldNameStr << "\");\n";
-        ss << "            set => Il2CppRuntime.SetField<" << typeName << ">(this, \"" << fieldNameStr << "\", value);\n";
-        ss << "        }\n\n";
+        Append(out, "        ", vis, " ", typeName, " ", displayFieldName, "\n"
+                    "        {\n"
+                    "            get => Il2CppRuntime.GetField<", typeName, ">(this, \"", fieldNameStr, "\");\n"
+                    "            set => Il2CppRuntime.SetField<", typeName, ">(this, \"", fieldNameStr, "\", value);\n"
+                    "        }\n\n");
     }
-
-    return ss.str();
 }
 
 /// Generate property wrappers (get_/set_ methods exposed as C# properties)
-static std::string GenerateClassProperties(il2cppClass* klass, const std::string& currentNamespace,
-                                            bool classIsStatic, const std::string& obfClassName) {
-    std::stringstream ss;
+static void GenerateClassProperties(il2cppClass* klass, const std::string& currentNamespace,
+                                    const std::string& obfClassName, std::string& out) {
     bool hasProperties = false;
 
     const char* classNsRaw = api::il2cpp_class_get_namespace(klass);
     const char* classNameRaw = api::il2cpp_class_get_name(klass);
     std::string classNs(classNsRaw ? classNsRaw : "");
     std::string className(classNameRaw ? classNameRaw : "");
-    std::string staticNs = classNs.empty() ? "Global" : classNs;
+    std::string staticNs = classNs.empty() ? GLOBAL_NAMESPACE : classNs;
 
     // Track emitted property names to avoid CS0102 duplicates (e.g., multiple 'Item' indexers)
     std::set<std::string> emittedPropNames;
@@ -899,14 +1124,14 @@ static std::string GenerateClassProperties(il2cppClass* klass, const std::string
         }
 
         // Skip explicit interface implementation properties
+        if (std::strchr(propName, '.')) continue;
         std::string propNameStr(propName);
-        if (propNameStr.find('.') != std::string::npos) continue;
 
         // Resolve property display name from mappings
         std::string displayPropName = propNameStr;
         bool propIsDeobfuscated = false;
         if (g_mappingLookup.HasMappings()) {
-            std::string friendly = g_mappingLookup.ResolveMember(obfClassName, propNameStr);
+            const std::string& friendly = g_mappingLookup.ResolveMember(obfClassName, propNameStr);
             if (!friendly.empty()) {
                 displayPropName = friendly;
                 propIsDeobfuscated = true;
@@ -919,15 +1144,15 @@ static std::string GenerateClassProperties(il2cppClass* klass, const std::string
         // Also skip if getter/setter method names indicate explicit interface impl
         if (get) {
             const char* getName = api::il2cpp_method_get_name(get);
-            if (getName && std::string(getName).find('.') != std::string::npos) continue;
+            if (getName && std::strchr(getName, '.')) continue;
         }
         if (set) {
             const char* setName = api::il2cpp_method_get_name(set);
-            if (setName && std::string(setName).find('.') != std::string::npos) continue;
+            if (setName && std::strchr(setName, '.')) continue;
         }
 
         std::string propTypeName;
-        std::string vis;
+        const char* vis = VIS_PUBLIC;
         bool isStatic = false;
         uint32_t iflags = 0;
 
@@ -935,97 +1160,173 @@ static std::string GenerateClassProperties(il2cppClass* klass, const std::string
             auto flags = api::il2cpp_method_get_flags(get, &iflags);
             vis = GetMethodVisibility(flags);
             isStatic = (flags & METHOD_ATTRIBUTE_STATIC) != 0;
-            auto retType = api::il2cpp_method_get_return_type(get);
-            propTypeName = GetFullyQualifiedTypeName(retType, currentNamespace);
-            // Interface return types can't be instantiated by GetField/Call — use Il2CppObject
-            auto retClass = api::il2cpp_class_from_type(retType);
-            if (retClass && (api::il2cpp_class_get_flags(retClass) & TYPE_ATTRIBUTE_INTERFACE))
-                propTypeName = "Il2CppObject";
+            propTypeName = GetWrapperTypeName(api::il2cpp_method_get_return_type(get), currentNamespace);
         } else if (set) {
             auto flags = api::il2cpp_method_get_flags(set, &iflags);
             vis = GetMethodVisibility(flags);
             isStatic = (flags & METHOD_ATTRIBUTE_STATIC) != 0;
-            auto param = api::il2cpp_method_get_param(set, 0);
-            propTypeName = GetFullyQualifiedTypeName(param, currentNamespace);
-            // Interface param types — use Il2CppObject
-            auto paramClass = api::il2cpp_class_from_type(param);
-            if (paramClass && (api::il2cpp_class_get_flags(paramClass) & TYPE_ATTRIBUTE_INTERFACE))
-                propTypeName = "Il2CppObject";
+            propTypeName = GetWrapperTypeName(api::il2cpp_method_get_param(set, 0), currentNamespace);
         }
 
         if (propTypeName.empty()) continue;
 
         if (!hasProperties) {
-            ss << "\n        // Properties\n";
+            out += "\n        // Properties\n";
             hasProperties = true;
         }
 
         if (propIsDeobfuscated) {
-            ss << "        /// <summary>Deobfuscated property. IL2CPP name: '" << propNameStr << "'</summary>\n";
+            Append(out, "        /// <summary>Deobfuscated property. IL2CPP name: '", propNameStr, "'</summary>\n");
         }
-        ss << "        " << vis;
-        if (isStatic) ss << " static";
-        ss << " " << propTypeName << " " << displayPropName << "\n";
-        ss << "        {\n";
+        Append(out, "        ", vis);
+        if (isStatic) out += " static";
+        Append(out, " ", propTypeName, " ", displayPropName, "\n"
+                    "        {\n");
 
         if (get) {
             if (isStatic) {
-                ss << "            get => Il2CppRuntime.CallStatic<" << propTypeName << ">(\""
-                   << staticNs << "\", \"" << className << "\", \"get_" << propNameStr
-                   << "\", global::System.Type.EmptyTypes);\n";
+                Append(out, "            get => Il2CppRuntime.CallStatic<", propTypeName, ">(\"",
+                            staticNs, "\", \"", className, "\", \"get_", propNameStr,
+                            "\", ", EMPTY_TYPES_EXPR, ");\n");
             } else {
-                ss << "            get => Il2CppRuntime.Call<" << propTypeName << ">(this, \"get_"
-                   << propNameStr << "\", global::System.Type.EmptyTypes);\n";
+                Append(out, "            get => Il2CppRuntime.Call<", propTypeName, ">(this, \"get_",
+                            propNameStr, "\", ", EMPTY_TYPES_EXPR, ");\n");
             }
         }
 
         if (set) {
             if (isStatic) {
-                ss << "            set => Il2CppRuntime.InvokeStaticVoid(\"" << staticNs << "\", \""
-                   << className << "\", \"set_" << propNameStr << "\", new[] { typeof("
-                   << propTypeName << ") }, value);\n";
+                Append(out, "            set => Il2CppRuntime.InvokeStaticVoid(\"", staticNs, "\", \"",
+                            className, "\", \"set_", propNameStr, "\", new[] { typeof(",
+                            propTypeName, ") }, value);\n");
             } else {
-                ss << "            set => Il2CppRuntime.InvokeVoid(this, \"set_" << propNameStr
-                   << "\", new[] { typeof(" << propTypeName << ") }, value);\n";
+                Append(out, "            set => Il2CppRuntime.InvokeVoid(this, \"set_", propNameStr,
+                            "\", new[] { typeof(", propTypeName, ") }, value);\n");
             }
         }
 
-        ss << "        }\n\n";
+        out += "        }\n\n";
     }
+}
+
+static const std::vector<std::string> NO_GENERIC_PARAMS;
+static const std::string NO_GENERIC_ARGS;
+
+/// Type parameter names for a generic method of the given arity: {"T"} for one,
+/// {"T0", "T1", ...} otherwise. Built once per arity (per thread) and shared.
+static const std::vector<std::string>& GenericParamNames(int arity) {
+    thread_local std::unordered_map<int, std::vector<std::string>> byArity;
 
-    return ss.str();
+    auto& names = byArity[arity];
+    if (names.empty()) {
+        names.reserve(arity);
+        if (arity == 1) {
+            names.push_back("T");
+        } else {
+            for (int gi = 0; gi < arity; ++gi)
+                names.push_back("T" + std::to_string(gi));
+        }
+    }
+    return names;
+}
+
+/// Lower `minMvar` to the smallest method generic-parameter (MVAR) index used by
+/// `type`, recursing into array element types and generic type arguments (List<T>).
+/// Only arrays and generic instances can nest, so every other type is one compare.
+static void ScanMinMvarIndex(const il2cppType* type, uint32_t& minMvar) {
+    if (!type) return;
+    switch (type->m_uType) {
+    case IL2CPP_TYPE_MVAR:
+        if (type->m_uGenericParameterIndex < minMvar)
+            minMvar = type->m_uGenericParameterIndex;
+        break;
+    case IL2CPP_TYPE_SZARRAY:
+        ScanMinMvarIndex(type->m_pType, minMvar);
+        break;
+    case IL2CPP_TYPE_GENERICINST:
+        if (type->m_pGenericClass) {
+            auto* classInst = type->m_pGenericClass->m_Context.m_pClassInst;
+            if (classInst && classInst->m_pTypeArgv) {
+                for (uint32_t gi = 0; gi < classInst->m_uTypeArgc; ++gi)
+                    ScanMinMvarIndex(classInst->m_pTypeArgv[gi], minMvar);
+            }
+        }
+        break;
+    default:
+        break;
+    }
+}
+
+/// "new global::System.Type[] { typeof(A), typeof(B) }" for the given type names
+static std::string TypeofArrayExpr(const std::vector<std::string>& typeNames) {
+    std::string expr = TYPE_ARRAY_OPEN;
+    const char* sep = "";
+    for (const auto& typeName : typeNames) {
+        Append(expr, sep, "typeof(", typeName, ")");
+        sep = ", ";
+    }
+    expr += " }";
+    return expr;
+}
+
+/// Type-argument array passed to the generic invoke helpers. Depends only on
+/// the arity, so it is built once per arity (per thread) like GenericParamNames.
+static const std::string& GenericArgsExpr(int arity) {
+    thread_local std::unordered_map<int, std::string> byArity;
+
+    auto& expr = byArity[arity];
+    if (expr.empty()) expr = TypeofArrayExpr(GenericParamNames(arity));
+    return expr;
 }
 
 /// Generate method wrappers
-static std::string GenerateClassMethods(il2cppClass* klass, const std::string& currentNamespace,
-                                         bool classIsStatic, const std::string& obfClassName) {
-    std::stringstream ss;
+static void GenerateClassMethods(il2cppClass* klass, const std::string& currentNamespace,
+                                 const std::string& obfClassName, std::string& out) {
     bool hasMethods = false;
 
-    // Collect property accessor names to skip
-    std::set<std::string> propertyMethods;
+    // Collect property accessor names ("get_<Prop>" / "set_<Prop>") to skip.
+    // The views point at the accessors' own metadata names when those match,
+    // so building the set allocates no strings in the common case.
+    std::unordered_set<std::string_view> propertyMethods;
+    std::vector<std::string> unusualAccessorNames;
     {
+        auto addAccessor = [&](const il2cppMethodInfo* accessor, const char* prefix, const char* propName) {
+            if (!accessor) return;
+            const char* accessorName = api::il2cpp_method_get_name(accessor);
+            if (accessorName && std::strncmp(accessorName, prefix, 4) == 0 && std::strcmp(accessorName + 4, propName) == 0) {
+                propertyMethods.insert(accessorName);
+            } else {
+                unusualAccessorNames.push_back(prefix + std::string(propName));
+            }
+        };
+
         void* piter = nullptr;
         while (auto prop_const = api::il2cpp_class_get_properties(klass, &piter)) {
             auto prop = const_cast<il2cppPropertyInfo*>(prop_const);
             auto propName = api::il2cpp_property_get_name(prop);
             if (propName) {
-                auto get = api::il2cpp_property_get_get_method(prop);
-                auto set = api::il2cpp_property_get_set_method(prop);
-                if (get) propertyMethods.insert("get_" + std::string(propName));
-                if (set) propertyMethods.insert("set_" + std::string(propName));
+                addAccessor(api::il2cpp_property_get_get_method(prop), "get_", propName);
+                addAccessor(api::il2cpp_property_get_set_method(prop), "set_", propName);
             }
         }
+        // Inserted after the vector stops growing so the views stay valid
+        for (const auto& name : unusualAccessorNames) propertyMethods.insert(name);
     }
 
     const char* classNsRaw = api::il2cpp_class_get_namespace(klass);
     const char* classNameRaw = api::il2cpp_class_get_name(klass);
     std::string classNs(classNsRaw ? classNsRaw : "");
     std::string className(classNameRaw ? classNameRaw : "");
-    std::string staticNs = classNs.empty() ? "Global" : classNs;
+    std::string staticNs = classNs.empty() ? GLOBAL_NAMESPACE : classNs;
+
+    // Track emitted signatures (generic arity + parameter type names) per method
+    // name to avoid CS0111 duplicates after type erasure. The type names of each
+    // emitted method are moved in once the method is written, so recording a
+    // signature builds no key string; a new name has nothing to compare against.
+    std::unordered_map<std::string, std::vector<std::pair<size_t, std::vector<std::string>>>> emittedOverloads;
 
-    // Track emitted method signatures to avoid CS0111 duplicates after type erasure
-    std::set<std::string> emittedMethodSigs;
+    // Parameter types of the current method; reused across methods to avoid reallocating
+    std::vector<const il2cppType*> paramTypes;
 
     void* iter = nullptr;
     while (auto method = api::il2cpp_class_get_methods(klass, &iter)) {
@@ -1041,9 +1342,11 @@ static std::string GenerateClassMethods(il2cppClass* klass, const std::string& c
 
         // Skip constructors, finalizers, and property accessors
         if (methodNameStr == ".ctor" || methodNameStr == ".cctor" || methodNameStr == "Finalize") continue;
-        if (propertyMethods.count(methodNameStr)) continue;
+        // Only get_/set_ names can be accessors; others skip the set probe
+        if ((methodName[0] == 'g' || methodName[0] == 's') && std::strncmp(methodName + 1, "et_", 3) == 0 &&
+            propertyMethods.count(methodNameStr)) continue;
         // Skip compiler-generated methods (local functions, state machines, etc.)
-        if (methodNameStr.find('<') != std::string::npos || methodNameStr.find('>') != std::string::npos) continue;
+        if (methodNameStr.find_first_of("<>") != std::string::npos) continue;
         // Skip explicit interface implementations (e.g., IResolvedStyle.get_maxHeight)
         // These contain a '.' that isn't at position 0 (unlike .ctor/.cctor)
         if (methodNameStr.find('.') != std::string::npos) continue;
@@ -1061,12 +1364,19 @@ static std::string GenerateClassMethods(il2cppClass* klass, const std::string& c
         // Skip abstract methods
         if (flags & METHOD_ATTRIBUTE_ABSTRACT) continue;
 
-        std::string vis = GetMethodVisibility(flags);
+        const char* vis = GetMethodVisibility(flags);
         bool isStatic = (flags & METHOD_ATTRIBUTE_STATIC) != 0;
 
+        // Return and parameter types, fetched once for the MVAR scan and the signature below
+        auto returnType = api::il2cpp_method_get_return_type(method);
+        auto paramCount = api::il2cpp_method_get_param_count(method);
+        paramTypes.clear();
+        for (uint32_t i = 0; i < paramCount; ++i)
+            paramTypes.push_back(api::il2cpp_method_get_param(method, i));
+
         // ── Generic method detection ──────────────────────────────────────
         bool isGenericMethod = method->m_uGeneric != 0;
-        std::vector<std::string> genericParamNames;   // e.g. {"T"} or {"T0","T1"}
+        const std::vector<std::string>* gpPtr = nullptr;   // e.g. {"T"} or {"T0","T1"}
         uint32_t mvarBaseIndex = 0;
 
         if (isGenericMethod && method->m_pGenericContainer) {
@@ -1075,82 +1385,51 @@ static std::string GenerateClassMethods(il2cppClass* klass, const std::string& c
             if (typeArgc <= 0) {
                 isGenericMethod = false;    // defensive: treat as non-generic
             } else {
-                if (typeArgc == 1) {
-                    genericParamNames.push_back("T");
-                } else {
-                    for (int gi = 0; gi < typeArgc; ++gi)
-                        genericParamNames.push_back("T" + std::to_string(gi));
-                }
+                gpPtr = &GenericParamNames(typeArgc);
 
                 // Discover the MVAR base index by scanning the method's return type and params.
                 // IL2CPP stores a global parameter index; we subtract the minimum to get a local one.
                 // Must recurse into SZARRAY elements and GENERICINST type args to find nested MVARs.
                 uint32_t minMvar = UINT32_MAX;
-                std::function<void(const il2cppType*)> scanMvar = [&](const il2cppType* t) {
-                    if (!t) return;
-                    if (t->m_uType == IL2CPP_TYPE_MVAR) {
-                        if (t->m_uGenericParameterIndex < minMvar)
-                            minMvar = t->m_uGenericParameterIndex;
-                    } else if (t->m_uType == IL2CPP_TYPE_SZARRAY) {
-                        // Recurse into array element type
-                        scanMvar(t->m_pType);
-                    } else if (t->m_uType == IL2CPP_TYPE_GENERICINST) {
-                        // Recurse into generic type arguments (e.g., List<T>)
-                        if (t->m_pGenericClass) {
-                            auto* classInst = t->m_pGenericClass->m_Context.m_pClassInst;
-                            if (classInst && classInst->m_pTypeArgv) {
-                                for (uint32_t gi = 0; gi < classInst->m_uTypeArgc; ++gi)
-                                    scanMvar(classInst->m_pTypeArgv[gi]);
-                            }
-                        }
-                    }
-                };
-                scanMvar(api::il2cpp_method_get_return_type(method));
-                for (uint32_t i = 0; i < api::il2cpp_method_get_param_count(method); ++i)
-                    scanMvar(api::il2cpp_method_get_param(method, i));
+                ScanMinMvarIndex(returnType, minMvar);
+                for (auto param : paramTypes)
+                    ScanMinMvarIndex(param, minMvar);
                 mvarBaseIndex = (minMvar == UINT32_MAX) ? 0 : minMvar;
             }
         } else {
             isGenericMethod = false;   // no container pointer
         }
 
-        const std::vector<std::string>* gpPtr = isGenericMethod ? &genericParamNames : nullptr;
+        const std::vector<std::string>& genericParamNames = gpPtr ? *gpPtr : NO_GENERIC_PARAMS;
 
-        // Return type
-        auto returnType = api::il2cpp_method_get_return_type(method);
-        std::string returnTypeName = GetFullyQualifiedTypeName(returnType, currentNamespace, gpPtr, mvarBaseIndex);
+        // Return type (interfaces can't be instantiated by Call<T> — they become Il2CppObject)
+        std::string returnTypeName = GetWrapperTypeName(returnType, currentNamespace, gpPtr, mvarBaseIndex);
         bool isVoid = (returnTypeName == "void");
 
-        // Interface return types can't be instantiated by Call<T> — use Il2CppObject
-        if (!isVoid) {
-            auto retClass = api::il2cpp_class_from_type(returnType);
-            if (retClass && (api::il2cpp_class_get_flags(retClass) & TYPE_ATTRIBUTE_INTERFACE))
-                returnTypeName = "Il2CppObject";
-        }
-
         // Collect parameters first (before writing) for dedup check
-        auto paramCount = api::il2cpp_method_get_param_count(method);
         std::vector<std::string> paramNames;
         std::vector<std::string> paramTypeNames;
-        std::vector<bool> paramIsByRef;
-        std::vector<std::string> paramRefKind;  // "", "out ", "in ", "ref "
+        std::vector<const char*> paramRefKind;  // REF_KIND_NONE / _OUT / _IN / _REF
+        paramNames.reserve(paramCount);
+        paramTypeNames.reserve(paramCount);
+        paramRefKind.reserve(paramCount);
         for (uint32_t i = 0; i < paramCount; ++i) {
-            auto param = api::il2cpp_method_get_param(method, i);
+            auto param = paramTypes[i];
             std::string pTypeName = GetFullyQualifiedTypeName(param, currentNamespace, gpPtr, mvarBaseIndex);
             const char* pName = api::il2cpp_method_get_param_name(method, i);
             std::string pNameStr = (pName && pName[0] != '\0') ? pName : ("arg" + std::to_string(i));
-            paramNames.push_back(pNameStr);
-            paramTypeNames.push_back(pTypeName);
+            paramNames.push_back(std::move(pNameStr));
+            paramTypeNames.push_back(std::move(pTypeName));
 
-            std::string refKind = "";
+            const char* refKind = REF_KIND_NONE;
             if (_il2cpp_type_is_byref(param)) {
                 auto pAttrs = param->m_uAttributes;
                 if (pAttrs & PARAM_ATTRIBUTE_OUT && !(pAttrs & PARAM_ATTRIBUTE_IN)) {
-                    refKind = "out ";
+                    refKind = REF_KIND_OUT;
                 } else if (pAttrs & PARAM_ATTRIBUTE_IN && !(pAttrs & PARAM_ATTRIBUTE_OUT)) {
-                    refKind = "in ";
+                    refKind = REF_KIND_IN;
                 } else {
-                    refKind = "ref ";
+                    refKind = REF_KIND_REF;
                 }
             }
             paramRefKind.push_back(refKind);
@@ -1161,236 +1440,450 @@ static std::string GenerateClassMethods(il2cppClass* klass, const std::string& c
         std::string displayMethodName = methodNameStr;
         bool methodIsDeobfuscated = false;
         if (g_mappingLookup.HasMappings()) {
-            std::string friendly = g_mappingLookup.ResolveMember(obfClassName, methodNameStr);
+            const std::string& friendly = g_mappingLookup.ResolveMember(obfClassName, methodNameStr);
             if (!friendly.empty()) {
                 displayMethodName = friendly;
                 methodIsDeobfuscated = true;
             }
         }
 
-        std::string sigKey = displayMethodName;
-        if (isGenericMethod) sigKey += "`" + std::to_string(genericParamNames.size());
-        sigKey += "(";
-        for (uint32_t i = 0; i < paramCount; ++i) {
-            if (i > 0) sigKey += ",";
-            sigKey += paramTypeNames[i];
+        auto& overloads = emittedOverloads[displayMethodName];
+        size_t genericArity = genericParamNames.size();
+        bool isDuplicate = false;
+        for (const auto& overload : overloads) {
+            if (overload.first == genericArity && overload.second == paramTypeNames) {
+                isDuplicate = true;
+                break;
+            }
         }
-        sigKey += ")";
-        if (!emittedMethodSigs.insert(sigKey).second) continue;  // skip duplicate
+        if (isDuplicate) continue;  // skip duplicate
+
+        // Type[] expression for the parameter types
+        std::string typeArrayExpr = paramTypeNames.empty() ? std::string(EMPTY_TYPES_EXPR)
+                                                           : TypeofArrayExpr(paramTypeNames);
 
         if (!hasMethods) {
-            ss << "\n        // Methods\n";
+            out += "\n        // Methods\n";
             hasMethods = true;
         }
 
         // Signature
         if (methodIsDeobfuscated) {
-            ss << "        /// <summary>Deobfuscated method. IL2CPP name: '" << methodNameStr << "'</summary>\n";
+            Append(out, "        /// <summary>Deobfuscated method. IL2CPP name: '", methodNameStr, "'</summary>\n");
         }
-        ss << "        " << vis;
-        if (isStatic) ss << " static";
-        ss << " " << returnTypeName << " " << displayMethodName;
+        Append(out, "        ", vis);
+        if (isStatic) out += " static";
+        Append(out, " ", returnTypeName, " ", displayMethodName);
         // Append generic type parameters for generic method definitions
         if (isGenericMethod) {
-            ss << "<";
-            for (size_t gi = 0; gi < genericParamNames.size(); ++gi) {
-                if (gi > 0) ss << ", ";
-                ss << genericParamNames[gi];
-            }
-            ss << ">";
+            out += "<";
+            AppendJoined(out, genericParamNames, ", ");
+            out += ">";
         }
-        ss << "(";
+        out += "(";
+        const char* sep = "";
         for (uint32_t i = 0; i < paramCount; ++i) {
-            if (i > 0) ss << ", ";
-            ss << paramRefKind[i] << paramTypeNames[i] << " " << paramNames[i];
+            Append(out, sep, paramRefKind[i], paramTypeNames[i], " ", paramNames[i]);
+            sep = ", ";
         }
-        ss << ")";
+        out += ")";
         // Emit generic constraints — use 'class' so Call<T> marshaling works for reference types
         if (isGenericMethod) {
             for (size_t gi = 0; gi < genericParamNames.size(); ++gi) {
-                ss << "\n            where " << genericParamNames[gi] << " : class";
+                Append(out, "\n            where ", genericParamNames[gi], " : class");
             }
         }
-        ss << "\n";
-        ss << "        {\n";
+        out += "\n"
+               "        {\n";
 
         // Emit default assignments for 'out' parameters (CS0269/CS0177)
         for (uint32_t i = 0; i < paramCount; ++i) {
-            if (paramRefKind[i] == "out ") {
-                ss << "            " << paramNames[i] << " = default;\n";
+            if (paramRefKind[i] == REF_KIND_OUT) {
+                Append(out, "            ", paramNames[i], " = default;\n");
             }
         }
 
-        // Build Type[] expression for parameter types
-        std::string typeArrayExpr;
-        if (paramCount == 0) {
-            typeArrayExpr = "global::System.Type.EmptyTypes";
-        } else {
-            typeArrayExpr = "new global::System.Type[] { ";
-            for (uint32_t i = 0; i < paramCount; ++i) {
-                if (i > 0) typeArrayExpr += ", ";
-                typeArrayExpr += "typeof(" + paramTypeNames[i] + ")";
-            }
-            typeArrayExpr += " }";
-        }
-
-        // Build generic args expression for generic methods
-        std::string genericArgsExpr;
-        if (isGenericMethod) {
-            genericArgsExpr = "new global::System.Type[] { ";
-            for (size_t gi = 0; gi < genericParamNames.size(); ++gi) {
-                if (gi > 0) genericArgsExpr += ", ";
-                genericArgsExpr += "typeof(" + genericParamNames[gi] + ")";
-            }
-            genericArgsExpr += " }";
-        }
+        // Type[] expression for the type arguments of generic methods
+        const std::string& genericArgsExpr = isGenericMethod ? GenericArgsExpr(static_cast<int>(genericParamNames.size()))
+                                                             : NO_GENERIC_ARGS;
 
         // Method body — use CallGeneric/InvokeGenericVoid for generic methods
         if (isGenericMethod) {
             // Generic method invocation (requires inflation)
             if (isStatic) {
                 if (isVoid) {
-                    ss << "            Il2CppRuntime.InvokeStaticGenericVoid(\"" << staticNs << "\", \""
-                       << className << "\", \"" << methodNameStr << "\", " << genericArgsExpr << ", " << typeArrayExpr;
+                    Append(out, "            Il2CppRuntime.InvokeStaticGenericVoid(\"", staticNs, "\", \"",
+                                className, "\", \"", methodNameStr, "\", ", genericArgsExpr, ", ", typeArrayExpr);
                 } else {
-                    ss << "            return Il2CppRuntime.CallStaticGeneric<" << returnTypeName << ">(\""
-                       << staticNs << "\", \"" << className << "\", \"" << methodNameStr << "\", " << genericArgsExpr << ", " << typeArrayExpr;
+                    Append(out, "            return Il2CppRuntime.CallStaticGeneric<", returnTypeName, ">(\"",
+                                staticNs, "\", \"", className, "\", \"", methodNameStr, "\", ", genericArgsExpr, ", ", typeArrayExpr);
                 }
             } else {
                 if (isVoid) {
-                    ss << "            Il2CppRuntime.InvokeGenericVoid(this, \"" << methodNameStr << "\", " << genericArgsExpr << ", " << typeArrayExpr;
+                    Append(out, "            Il2CppRuntime.InvokeGenericVoid(this, \"", methodNameStr, "\", ", genericArgsExpr, ", ", typeArrayExpr);
                 } else {
-                    ss << "            return Il2CppRuntime.CallGeneric<" << returnTypeName << ">(this, \""
-                       << methodNameStr << "\", " << genericArgsExpr << ", " << typeArrayExpr;
+                    Append(out, "            return Il2CppRuntime.CallGeneric<", returnTypeName, ">(this, \"",
+                                methodNameStr, "\", ", genericArgsExpr, ", ", typeArrayExpr);
                 }
             }
         } else {
             // Non-generic method invocation (original path)
             if (isStatic) {
                 if (isVoid) {
-                    ss << "            Il2CppRuntime.InvokeStaticVoid(\"" << staticNs << "\", \""
-                       << className << "\", \"" << methodNameStr << "\", " << typeArrayExpr;
+                    Append(out, "            Il2CppRuntime.InvokeStaticVoid(\"", staticNs, "\", \"",
+                                className, "\", \"", methodNameStr, "\", ", typeArrayExpr);
                 } else {
-                    ss << "            return Il2CppRuntime.CallStatic<" << returnTypeName << ">(\""
-                       << staticNs << "\", \"" << className << "\", \"" << methodNameStr << "\", " << typeArrayExpr;
+                    Append(out, "            return Il2CppRuntime.CallStatic<", returnTypeName, ">(\"",
+                                staticNs, "\", \"", className, "\", \"", methodNameStr, "\", ", typeArrayExpr);
                 }
             } else {
                 if (isVoid) {
-                    ss << "            Il2CppRuntime.InvokeVoid(this, \"" << methodNameStr << "\", " << typeArrayExpr;
+                    Append(out, "            Il2CppRuntime.InvokeVoid(this, \"", methodNameStr, "\", ", typeArrayExpr);
                 } else {
-                    ss << "            return Il2CppRuntime.Call<" << returnTypeName << ">(this, \""
-                       << methodNameStr << "\", " << typeArrayExpr;
+                    Append(out, "            return Il2CppRuntime.Call<", returnTypeName, ">(this, \"",
+                                methodNameStr, "\", ", typeArrayExpr);
                 }
             }
         }
 
         // Append arguments
         for (uint32_t i = 0; i < paramCount; ++i) {
-            ss << ", " << paramNames[i];
+            Append(out, ", ", paramNames[i]);
         }
-        ss << ");\n";
-        ss << "        }\n\n";
-    }
+        out += ");\n"
+               "        }\n\n";
 
-    return ss.str();
+        // Record the signature; the type names are no longer needed here
+        overloads.emplace_back(genericArity, std::move(paramTypeNames));
+    }
 }
 
 /// Generate a full class wrapper
-static std::string GenerateClass(const ClassInfo& info, const std::string& currentNamespace) {
-    std::stringstream ss;
-
-    // Determine display name (info.name may already be friendly after Phase 1.6)
-    std::string displayName = info.name;
-    bool isDeobfuscated = (info.name != SanitizeTypeName(info.rawName));
+static void GenerateClass(const ClassInfo& info, const std::string& currentNamespace, std::string& out) {
+    // Determine display name (info.name may already be friendly after Phase 1.6).
+    // Unlike the other kinds, a class only counts as deobfuscated when the
+    // mapping actually renamed it: an identity mapping gets no doc comment.
+    const std::string& displayName = info.name;
+    bool isDeobfuscated = info.is_deobfuscated && info.name != SanitizeTypeName(info.rawName);
 
     if (isDeobfuscated) {
-        ss << "    /// <summary>Deobfuscated class. IL2CPP name: '" << info.rawName << "'</summary>\n";
+        Append(out, "    /// <summary>Deobfuscated class. IL2CPP name: '", info.rawName, "'</summary>\n");
     }
 
-    ss << "    " << info.visibility << " partial class " << displayName << " : " << info.base_class << "\n";
-    ss << "    {\n";
-
-    // IL2CPP metadata constants (always emit for runtime reflection)
-    ss << "        public const string _il2cppClassName = \"" << info.rawName << "\";\n";
-    ss << "        public const string _il2cppNamespace = \"" << info.rawNs << "\";\n\n";
-
-    ss << "        public " << displayName << "(IntPtr nativePtr) : base(nativePtr) { }\n";
+    // Declaration, IL2CPP metadata constants (always emitted for runtime reflection)
+    // and the native-pointer constructor go out as one block
+    Append(out, "    ", info.visibility, " partial class ", displayName, " : ", info.base_class, "\n"
+                "    {\n"
+                "        public const string _il2cppClassName = \"", info.rawName, "\";\n"
+                "        public const string _il2cppNamespace = \"", info.rawNs, "\";\n\n"
+                "        public ", displayName, "(IntPtr nativePtr) : base(nativePtr) { }\n");
 
     // Fields as properties (skip for static classes)
     if (!info.is_static) {
-        ss << GenerateClassFields(info.klass, currentNamespace, info.rawName);
+        GenerateClassFields(info.klass, currentNamespace, info.rawName, out);
     }
 
     // Properties
-    ss << GenerateClassProperties(info.klass, currentNamespace, info.is_static, info.rawName);
+    GenerateClassProperties(info.klass, currentNamespace, info.rawName, out);
 
     // Methods
-    ss << GenerateClassMethods(info.klass, currentNamespace, info.is_static, info.rawName);
+    GenerateClassMethods(info.klass, currentNamespace, info.rawName, out);
 
-    ss << "    }\n";
-    return ss.str();
+    out += "    }\n";
 }
 
 // ============================================================================
 // File-Level Wrapper Generation
 // ============================================================================
 
-/// Build the using-statements header, excluding the file's own namespace
-static std::string BuildUsingStatements(const std::string& fileNamespace) {
-    std::stringstream ss;
-
-    ss << "using System;\n";
-    ss << "using System.Collections;\n";
-    ss << "using System.Collections.Generic;\n";
-    ss << "using GameSDK;\n";
-    ss << "\n";
-    ss << "// Core Unity namespace references\n";
-    ss << "using TMPro;\n";
-    ss << "using Unity.Mathematics;\n";
-
-    auto maybeUsing = [&](const std::string& ns) {
-        if (ns != fileNamespace) {
-            ss << "using " << ns << ";\n";
-        }
+/// Append the using-statements header, excluding the file's own namespace.
+/// Written straight into the file buffer; no intermediate string is built.
+static void AppendUsingStatements(const std::string& fileNamespace, std::string& out) {
+    // The using block is identical for every file apart from dropping a
+    // self-import, so the fixed parts are plain literals appended as-is.
+    static const char USING_HEAD[] =
+        "using System;\n"
+        "using System.Collections;\n"
+        "using System.Collections.Generic;\n"
+        "using GameSDK;\n"
+        "\n"
+        "// Core Unity namespace references\n"
+        "using TMPro;\n"
+        "using Unity.Mathematics;\n";
+
+    static const char USING_TAIL[] =
+        "\n// System namespaces for common types\n"
+        "using System.Text;\n"
+        "using System.IO;\n"
+        "using System.Xml;\n"
+        "using System.Reflection;\n"
+        "using System.Globalization;\n"
+        "using System.Runtime.Serialization;\n"
+        "using System.Threading;\n"
+        "using System.Threading.Tasks;\n";
+
+    static const char* const UNITY_USINGS[] = {
+        "UnityEngine",
+        "UnityEngine.AI",
+        "UnityEngine.Animations",
+        "UnityEngine.Audio",
+        "UnityEngine.EventSystems",
+        "UnityEngine.Events",
+        "UnityEngine.Rendering",
+        "UnityEngine.SceneManagement",
+        "UnityEngine.UI",
     };
 
-    maybeUsing("UnityEngine");
-    maybeUsing("UnityEngine.AI");
-    maybeUsing("UnityEngine.Animations");
-    maybeUsing("UnityEngine.Audio");
-    maybeUsing("UnityEngine.EventSystems");
-    maybeUsing("UnityEngine.Events");
-    maybeUsing("UnityEngine.Rendering");
-    maybeUsing("UnityEngine.SceneManagement");
-    maybeUsing("UnityEngine.UI");
-
-    ss << "\n// System namespaces for common types\n";
-    ss << "using System.Text;\n";
-    ss << "using System.IO;\n";
-    ss << "using System.Xml;\n";
-    ss << "using System.Reflection;\n";
-    ss << "using System.Globalization;\n";
-    ss << "using System.Runtime.Serialization;\n";
-    ss << "using System.Threading;\n";
-    ss << "using System.Threading.Tasks;\n";
-
-    return ss.str();
+    out += USING_HEAD;
+    for (const char* ns : UNITY_USINGS) {
+        if (fileNamespace != ns) Append(out, "using ", ns, ";\n");
+    }
+    out += USING_TAIL;
+}
+
+/// Wrapper file name for a namespace: "GameSDK.<Namespace>.cs", dots → underscores.
+/// Built in one presized pass rather than copy + replace + two concatenations.
+static std::string WrapperFileName(const std::string& ns) {
+    std::string_view safeNs = ns.empty() ? std::string_view(GLOBAL_NAMESPACE) : std::string_view(ns);
+
+    std::string filename;
+    filename.reserve(safeNs.size() + 11);   // "GameSDK." + ".cs"
+    filename += "GameSDK.";
+    for (char c : safeNs) filename += (c == '.') ? '_' : c;
+    filename += ".cs";
+    return filename;
+}
+
+/// Fingerprint of one wrapper file as it was left on disk (one manifest line)
+struct WrapperFileRecord {
+    uint64_t content_hash = 0;
+    uint64_t size = 0;
+    int64_t write_time = 0;        // last_write_time ticks after the file was written or verified
+};
+
+/// Wrapper file name -> fingerprint
+using WrapperManifest = std::unordered_map<std::string, WrapperFileRecord>;
+
+/// Outcome of generating one GameSDK.<Namespace>.cs file
+struct NamespaceFileResult {
+    std::string file_path;
+    std::string error_message;     // non-empty if the file could not be written
+    size_t wrappers_generated = 0;
+    bool unchanged = false;        // existing file already had this content; not rewritten
+    WrapperFileRecord record;
+};
+
+/// 64-bit FNV-1a over the generated file
+static uint64_t HashContent(const std::string& content) {
+    uint64_t hash = 14695981039346656037ull;
+    for (unsigned char c : content) {
+        hash ^= c;
+        hash *= 1099511628211ull;
+    }
+    return hash;
+}
+
+static int64_t WriteTimeTicks(const std::filesystem::path& path) {
+    std::error_code ec;
+    auto time = std::filesystem::last_write_time(path, ec);
+    return ec ? 0 : static_cast<int64_t>(time.time_since_epoch().count());
+}
+
+/// Load the previous run's manifest. Missing or unreadable -> empty, and every
+/// file falls back to the byte comparison.
+static WrapperManifest LoadWrapperManifest(const std::filesystem::path& path) {
+    WrapperManifest manifest;
+    std::ifstream in(path);
+    if (!in.is_open()) return manifest;
+
+    WrapperFileRecord record;
+    std::string fileName;
+    while (in >> std::hex >> record.content_hash >> std::dec >> record.size >> record.write_time >> fileName) {
+        manifest[fileName] = record;
+    }
+    return manifest;
 }
 
-/// Produce a safe filename from a namespace: dots → underscores
-static std::string SafeFileName(const std::string& ns) {
-    std::string safe = ns;
-    std::replace(safe.begin(), safe.end(), '.', '_');
-    if (safe.empty()) safe = "Global";
-    return safe;
+static void SaveWrapperManifest(const std::filesystem::path& path, const std::vector<NamespaceFileResult>& results) {
+    std::ofstream out(path, std::ios::binary);
+    if (!out.is_open()) return;
+    for (const auto& nsResult : results) {
+        out << std::hex << nsResult.record.content_hash << std::dec << ' ' << nsResult.record.size << ' '
+            << nsResult.record.write_time << ' '
+            << std::filesystem::path(nsResult.file_path).filename().string() << '\n';
+    }
+}
+
+/// True if `path` exists and holds exactly `content`. The size check rejects
+/// almost every changed file before anything is read; the rest is compared in
+/// fixed-size chunks, so no second copy of a large file is ever held.
+static bool FileHasContent(const std::filesystem::path& path, const std::string& content) {
+    std::error_code ec;
+    auto size = std::filesystem::file_size(path, ec);
+    if (ec || size != content.size()) return false;
+
+    std::ifstream in(path, std::ios::binary);
+    if (!in.is_open()) return false;
+
+    char chunk[64 * 1024];
+    size_t offset = 0;
+    while (offset < content.size()) {
+        size_t want = (std::min)(sizeof(chunk), content.size() - offset);
+        in.read(chunk, static_cast<std::streamsize>(want));
+        if (in.gcount() != static_cast<std::streamsize>(want)) return false;
+        if (std::memcmp(chunk, content.data() + offset, want) != 0) return false;
+        offset += want;
+    }
+    return true;
+}
+
+/// Write `content` to `path` in one binary write through a sibling ".tmp" file
+/// that is then renamed over the target. A run interrupted mid-write leaves
+/// the previous file intact, never a truncated one for the build to compile.
+static bool WriteFileAtomic(const std::filesystem::path& path, const std::string& content) {
+    std::filesystem::path tmpPath = path;
+    tmpPath += ".tmp";
+
+    std::ofstream out(tmpPath, std::ios::binary);
+    if (!out.is_open()) return false;
+    out.write(content.data(), static_cast<std::streamsize>(content.size()));
+    out.close();
+
+    std::error_code ec;
+    if (out) std::filesystem::rename(tmpPath, path, ec);
+    if (!out || ec) {
+        std::filesystem::remove(tmpPath, ec);
+        return false;
+    }
+    return true;
+}
+
+/// Generate and write the wrapper file for one namespace.
+/// Runs on a Phase 2 worker thread, attached to the IL2CPP domain by ParallelFor:
+/// the generators query methods, fields and properties, read static enum values
+/// and build inflated classes for generic/array types, all of which IL2CPP may
+/// set up lazily. Apart from that it only writes its own output file and reads
+/// dumper state that is frozen before Phase 2.
+static NamespaceFileResult GenerateNamespaceFile(const std::string& ns, const std::vector<ClassInfo>& types,
+                                                 const std::string& output_directory,
+                                                 const WrapperManifest& previous) {
+    NamespaceFileResult nsResult;
+    // Every generator appends straight into this one buffer
+    std::string file;
+    file.reserve(64 * 1024);
+
+    // File header, using statements and namespace declaration
+    Append(file, FILE_HEADER_OPEN, ns, FILE_HEADER_CLOSE);
+    AppendUsingStatements(ns, file);
+    Append(file, "\n"
+                 "namespace ", ns, "\n"
+                 "{\n");
+
+    // Order types: delegates → enums → interfaces → structs → classes.
+    // One pass bins them by kind (keeping collection order within a kind),
+    // which is what the previous stable sort produced, without moving ClassInfos.
+    std::array<std::vector<const ClassInfo*>, TYPE_KIND_COUNT> byKind;
+    for (const auto& info : types) {
+        byKind[static_cast<size_t>(info.kind)].push_back(&info);
+    }
+
+    // Drop duplicate type names up front to avoid CS0101 duplicate definitions.
+    // Bins are filtered in emission order, so the first definition still wins.
+    std::unordered_set<std::string_view> typeNames;
+    typeNames.reserve(types.size());
+    for (auto& kindTypes : byKind) {
+        kindTypes.erase(std::remove_if(kindTypes.begin(), kindTypes.end(),
+                                       [&](const ClassInfo* info) { return !typeNames.insert(info->name).second; }),
+                        kindTypes.end());
+    }
+
+    for (const auto& kindTypes : byKind) {
+        for (const ClassInfo* infoPtr : kindTypes) {
+            const ClassInfo& info = *infoPtr;
+            switch (info.kind) {
+            case TypeKind::Delegate:
+                GenerateDelegate(info, ns, file);
+                file += "\n";
+                break;
+            case TypeKind::Enum:
+                GenerateEnum(info, file);
+                file += "\n";
+                break;
+            case TypeKind::Interface:
+                GenerateInterface(info, file);
+                file += "\n";
+                break;
+            case TypeKind::Struct:
+                GenerateStruct(info, ns, file);
+                file += "\n";
+                break;
+            case TypeKind::Class:
+                GenerateClass(info, ns, file);
+                file += "\n";
+                nsResult.wrappers_generated++;
+                break;
+            }
+        }
+    }
+
+    file += "}\n";
+
+    // Write file: GameSDK.<SafeNamespace>.cs
+    std::string fileName = WrapperFileName(ns);
+    std::filesystem::path filePath = std::filesystem::path(output_directory) / fileName;
+    nsResult.file_path = filePath.string();
+    nsResult.record.content_hash = HashContent(file);
+    nsResult.record.size = file.size();
+
+    // Leave byte-identical files alone: no write, and the unchanged timestamp
+    // lets MSBuild's incremental checks see that nothing changed. The manifest
+    // settles most files from the hash alone; a file touched since the last run
+    // (timestamp differs) or missing from the manifest is compared byte-for-byte.
+    bool unchanged = false;
+    auto prev = previous.find(fileName);
+    if (prev == previous.end()) {
+        unchanged = FileHasContent(filePath, file);
+    } else if (prev->second.content_hash == nsResult.record.content_hash &&
+               prev->second.size == nsResult.record.size) {
+        unchanged = WriteTimeTicks(filePath) == prev->second.write_time || FileHasContent(filePath, file);
+    }
+    if (unchanged) {
+        nsResult.unchanged = true;
+        nsResult.record.write_time = WriteTimeTicks(filePath);
+        return nsResult;
+    }
+
+    // One binary write of the finished buffer: no text-mode newline translation
+    // pass, and the file keeps the "\n" endings the generators emit.
+    if (!WriteFileAtomic(filePath, file)) {
+        nsResult.error_message = "Failed to write: " + filePath.string();
+        return nsResult;
+    }
+
+    nsResult.record.write_time = WriteTimeTicks(filePath);
+    return nsResult;
 }
 
 // ============================================================================
 // Main Dump & Generate Function
 // ============================================================================
 
+/// <game>\MDB\Dump, next to the game executable. Resolved once per process:
+/// the report and mappings phases both need it.
+static const std::string& GetDumpDirectory() {
+    static const std::string dumpDir = [] {
+        char exePath[MAX_PATH];
+        GetModuleFileNameA(nullptr, exePath, MAX_PATH);
+        std::string exeDir(exePath);
+        size_t lastSlash = exeDir.find_last_of("\\/");
+        if (lastSlash != std::string::npos) exeDir.resize(lastSlash);
+        return exeDir + "\\MDB\\Dump";
+    }();
+    return dumpDir;
+}
+
 DumpResult DumpIL2CppRuntime(const std::string& output_directory) {
-    DumpResult result = { false, "", "", "", 0, 0, {}, 0, 0, 0, 0 };
+    DumpResult result = { false, "", "", "", 0, 0, {}, 0, 0, 0, 0, 0 };
 
     // ---- Wait for GameAssembly.dll ----
     uintptr_t gaBase = GetGameAssemblyBaseAddress();
@@ -1436,12 +1929,7 @@ DumpResult DumpIL2CppRuntime(const std::string& output_directory) {
 
     // Write BeeByte report to MDB/Dump/fake_methods.txt
     {
-        char exePath[MAX_PATH];
-        GetModuleFileNameA(nullptr, exePath, MAX_PATH);
-        std::string exeDir(exePath);
-        size_t lastSlash = exeDir.find_last_of("\\/");
-        if (lastSlash != std::string::npos) exeDir = exeDir.substr(0, lastSlash);
-        std::string dumpDir = exeDir + "\\MDB\\Dump";
+        const std::string& dumpDir = GetDumpDirectory();
         std::filesystem::create_directories(dumpDir);
         std::string fakeReportPath = dumpDir + "\\fake_methods.txt";
         obfuscation_detector.WriteFakeReport(fakeReportPath);
@@ -1453,78 +1941,60 @@ DumpResult DumpIL2CppRuntime(const std::string& output_directory) {
     size_t totalClasses = 0;
 
     // Also build the image list for the raw diagnostic dump
-    std::stringstream rawDump;
+    std::string rawDump;
     for (size_t i = 0; i < size; ++i) {
         auto image = api::il2cpp_assembly_get_image(assemblies[i]);
-        rawDump << "// Image " << i << ": " << api::il2cpp_image_get_name(image) << "\n";
+        Append(rawDump, "// Image ", std::to_string(i), ": ", api::il2cpp_image_get_name(image), "\n");
     }
 
-    for (size_t i = 0; i < size; ++i) {
-        auto image = api::il2cpp_assembly_get_image(assemblies[i]);
-        std::string dllName = api::il2cpp_image_get_name(image);
-        auto classCount = api::il2cpp_image_get_class_count(image);
-        totalClasses += classCount;
-
-        for (size_t j = 0; j < classCount; ++j) {
-            auto klass = api::il2cpp_image_get_class(image, j);
-            if (!klass) continue;
-
-            const char* ns = api::il2cpp_class_get_namespace(klass);
-            const char* name = api::il2cpp_class_get_name(klass);
-            if (!name) continue;
-
-            std::string nsStr(ns ? ns : "");
-            std::string nameStr(name);
+    // Assemblies are independent, so each one is classified on an attached worker
+    // thread into its own list. The lists are merged in assembly order so the
+    // generated files are identical to a serial run (first definition of a
+    // duplicate name wins).
+    std::vector<std::vector<ClassInfo>> collectedByAssembly(size);
+    std::vector<size_t> classCountByAssembly(size, 0);
 
-            // Skip compiler-generated types
-            if (nameStr.find('<') != std::string::npos) continue;
-            if (nameStr.find('>') != std::string::npos) continue;
-            if (nameStr.find('/') != std::string::npos) continue;
-
-            // Skip system/internal namespaces (check raw namespace first)
-            if (ShouldSkipNamespace(nsStr)) continue;
-
-            // Skip non-public types
-            int flags = api::il2cpp_class_get_flags(klass);
-            auto vis = flags & TYPE_ATTRIBUTE_VISIBILITY_MASK;
-            if (vis != TYPE_ATTRIBUTE_PUBLIC && vis != TYPE_ATTRIBUTE_NESTED_PUBLIC) continue;
-
-            // Obfuscation filter: skip entirely-fake classes
-            if (g_obfuscation_detector && g_obfuscation_detector->IsEntirelyFakeClass(klass)) continue;
-
-            // Resolve effective namespace: nested types inherit their declaring type's namespace
-            std::string resolvedNs = nsStr.empty() ? ResolveEffectiveNamespace(klass) : nsStr;
-
-            // Re-check the resolved namespace — nested types from System/Mono/etc. must also be skipped
-            if (resolvedNs != nsStr && ShouldSkipNamespace(resolvedNs)) continue;
-
-            std::string bucketNs = resolvedNs.empty() ? "Global" : resolvedNs;
+    ParallelFor(size, [&](size_t i) {
+        auto image = api::il2cpp_assembly_get_image(assemblies[i]);
+        classCountByAssembly[i] = CollectAssemblyTypes(image, collectedByAssembly[i]);
+    });
 
-            ClassInfo info = ClassifyType(klass, dllName, bucketNs);
-            typesByNamespace[bucketNs].push_back(info);
+    // Types of one namespace are usually contiguous within an assembly, so the
+    // bucket from the previous type is reused instead of re-probing the map.
+    std::vector<ClassInfo>* bucket = nullptr;
+    const std::string* bucketNs = nullptr;
+    for (size_t i = 0; i < size; ++i) {
+        totalClasses += classCountByAssembly[i];
+        for (auto& info : collectedByAssembly[i]) {
+            if (!bucketNs || *bucketNs != info.ns) {
+                auto it = typesByNamespace.try_emplace(info.ns).first;
+                bucket = &it->second;
+                bucketNs = &it->first;
+            }
+            bucket->push_back(std::move(info));
         }
     }
+    collectedByAssembly.clear();
     result.total_classes = totalClasses;
 
     // ---- Phase 1.5: Build known types registry ----
     g_knownTypes.clear();
+    {
+        size_t typeCount = 0;
+        for (const auto& [regNs, regTypes] : typesByNamespace) typeCount += regTypes.size();
+        g_knownTypes.reserve(typeCount);
+    }
     for (const auto& [regNs, regTypes] : typesByNamespace) {
         for (const auto& regInfo : regTypes) {
             // Use the effective namespace (which includes resolved declaring type namespace)
-            std::string effectiveNs = regInfo.ns == "Global" ? "" : regInfo.ns;
-            std::string fqn = effectiveNs.empty() ? regInfo.name : (effectiveNs + "." + regInfo.name);
-            g_knownTypes.insert(fqn);
+            g_knownTypes[regInfo.name].insert(regInfo.ns == GLOBAL_NAMESPACE ? std::string() : regInfo.ns);
         }
     }
+    InvalidateClassNameCache();
 
     // ---- Phase 1.6: Load deobfuscation mappings & apply friendly names ----
     {
-        char exePath2[MAX_PATH];
-        GetModuleFileNameA(nullptr, exePath2, MAX_PATH);
-        std::string exeDir2(exePath2);
-        size_t ls2 = exeDir2.find_last_of("\\/");
-        if (ls2 != std::string::npos) exeDir2 = exeDir2.substr(0, ls2);
-        std::string mappingsPath = exeDir2 + "\\MDB\\Dump\\mappings.json";
+        std::string mappingsPath = GetDumpDirectory() + "\\mappings.json";
 
         if (g_mappingLookup.Load(mappingsPath)) {
             result.mappings_loaded = g_mappingLookup.TotalCount();
@@ -1532,119 +2002,72 @@ DumpResult DumpIL2CppRuntime(const std::string& output_directory) {
             // Update ClassInfo display names with friendly names from mappings
             for (auto& [mapNs, mapTypes] : typesByNamespace) {
                 for (auto& mapInfo : mapTypes) {
-                    std::string friendly = g_mappingLookup.ResolveType(mapInfo.rawName);
+                    const std::string& friendly = g_mappingLookup.ResolveType(mapInfo.rawName);
                     if (!friendly.empty()) {
                         mapInfo.name = friendly;
+                        mapInfo.is_deobfuscated = true;
                     }
                 }
             }
         }
+        InvalidateClassNameCache();
     }
 
-    // Re-validate base classes against known types registry
+    // Resolve base classes against the known types registry
     // (Now that g_mappingLookup is loaded, GetFullyQualifiedClassName will
     //  apply friendly name remapping to base class references too)
-    for (auto& [valNs, valTypes] : typesByNamespace) {
-        for (auto& valInfo : valTypes) {
-            if (valInfo.kind == TypeKind::Class && !valInfo.base_class.empty() && valInfo.base_class != "Il2CppObject") {
-                auto* parent = api::il2cpp_class_get_parent(valInfo.klass);
-                if (parent) {
-                    valInfo.base_class = GetFullyQualifiedClassName(parent, valInfo.ns);
-                    if (valInfo.base_class.empty() || valInfo.base_class == "object") {
-                        valInfo.base_class = "Il2CppObject";
-                    }
-                    // Detect circular base type (e.g., FancyScrollView<T,U> extends FancyScrollView<T>)
-                    std::string baseTail = valInfo.base_class;
-                    auto lastDot = baseTail.rfind('.');
-                    if (lastDot != std::string::npos) baseTail = baseTail.substr(lastDot + 1);
-                    if (baseTail == valInfo.name) {
-                        valInfo.base_class = "Il2CppObject";
-                    }
-                }
-            }
-        }
-    }
+    ResolveBaseClasses(typesByNamespace);
 
     // ---- Phase 2: Generate .cs files per namespace ----
     std::filesystem::create_directories(output_directory);
 
+    // Namespaces are independent: each worker (attached to the IL2CPP domain,
+    // see ParallelFor) builds and writes its own file. Results are collected per
+    // namespace and reported in map order, so the file list and counters match
+    // a serial run.
+    std::vector<std::pair<const std::string*, const std::vector<ClassInfo>*>> namespaceJobs;
+    namespaceJobs.reserve(typesByNamespace.size());
     for (auto& [ns, types] : typesByNamespace) {
-        if (types.empty()) continue;
-
-        std::stringstream file;
-
-        // File header
-        file << "// Auto-generated Il2Cpp wrapper classes\n";
-        file << "// Namespace: " << ns << "\n";
-        file << "// Do not edit manually\n\n";
-        file << "#pragma warning disable 0108, 0114, 0162, 0168, 0219\n\n";
-
-        // Using statements
-        file << BuildUsingStatements(ns) << "\n";
-
-        // Namespace declaration
-        file << "namespace " << ns << "\n";
-        file << "{\n";
-
-        // Sort types: delegates → enums → interfaces → structs → classes
-        std::stable_sort(types.begin(), types.end(), [](const ClassInfo& a, const ClassInfo& b) {
-            return static_cast<int>(a.kind) < static_cast<int>(b.kind);
-        });
-
-        // Track emitted type names to avoid CS0101 duplicate definitions
-        std::set<std::string> emittedTypes;
-
-        for (const auto& info : types) {
-            // Skip duplicate type names within the same namespace
-            if (!emittedTypes.insert(info.name).second) continue;
-
-            switch (info.kind) {
-            case TypeKind::Delegate:
-                file << GenerateDelegate(info.klass, ns, info.rawName) << "\n";
-                break;
-            case TypeKind::Enum:
-                file << GenerateEnum(info.klass, info.rawName) << "\n";
-                break;
-            case TypeKind::Interface:
-                file << GenerateInterface(info.klass, info.rawName) << "\n";
-                break;
-            case TypeKind::Struct:
-                file << GenerateStruct(info.klass, ns, info.rawName) << "\n";
-                break;
-            case TypeKind::Class:
-                file << GenerateClass(info, ns) << "\n";
-                result.total_wrappers_generated++;
-                break;
-            }
-        }
+        if (!types.empty()) namespaceJobs.emplace_back(&ns, &types);
+    }
 
-        file << "}\n";
+    const std::filesystem::path manifestPath = std::filesystem::path(output_directory) / WRAPPERS_MANIFEST_FILE;
+    const WrapperManifest previousManifest = LoadWrapperManifest(manifestPath);
 
-        // Write file: GameSDK.<SafeNamespace>.cs
-        std::string safeName = SafeFileName(ns);
-        std::string filename = "GameSDK." + safeName + ".cs";
-        std::filesystem::path filePath = std::filesystem::path(output_directory) / filename;
+    std::vector<NamespaceFileResult> namespaceResults(namespaceJobs.size());
+    ParallelFor(namespaceJobs.size(), [&](size_t i) {
+        namespaceResults[i] = GenerateNamespaceFile(*namespaceJobs[i].first, *namespaceJobs[i].second,
+                                                    output_directory, previousManifest);
+    });
 
-        std::ofstream outFile(filePath);
-        if (!outFile.is_open()) {
-            result.error_message = "Failed to write: " + filePath.string();
+    for (auto& nsResult : namespaceResults) {
+        if (!nsResult.error_message.empty()) {
+            result.error_message = nsResult.error_message;
             return result;
         }
-        outFile << file.str();
-        outFile.close();
-
-        result.generated_files.push_back(filePath.string());
+        result.total_wrappers_generated += nsResult.wrappers_generated;
+        if (nsResult.unchanged) result.unchanged_files++;
+        result.generated_files.push_back(nsResult.file_path);
     }
+    SaveWrapperManifest(manifestPath, namespaceResults);
 
     // ---- Phase 3: Write raw dump.cs for diagnostics ----
+    // dump.cs sits among the compiled sources, so like the wrapper files it is
+    // only rewritten (one binary write) when its content changes
     std::string dumpPath = output_directory + "\\dump.cs";
-    std::ofstream rawOut(dumpPath);
-    if (rawOut.is_open()) {
-        rawOut << rawDump.str();
-        rawOut.close();
+    if (!FileHasContent(dumpPath, rawDump)) {
+        WriteFileAtomic(dumpPath, rawDump);
     }
     result.dump_path = dumpPath;
 
+    // Stamp the generation time. Unchanged wrapper files keep their old timestamps,
+    // so AreWrappersFresh dates the wrappers by this stamp rather than by the files.
+    std::ofstream stampOut(std::filesystem::path(output_directory) / WRAPPERS_STAMP_FILE, std::ios::binary);
+    if (stampOut.is_open()) {
+        stampOut << result.generated_files.size() << " wrapper files\n";
+        stampOut.close();
+    }
+
     // Clean up global detector pointer (stack-allocated, about to go out of scope)
     g_obfuscation_detector = nullptr;
 
@@ -1677,14 +2100,6 @@ bool IsDumpFresh(const std::string& dump_path) {
 }
 
 bool AreWrappersFresh(const std::string& output_directory) {
-    if (!std::filesystem::exists(output_directory)) return false;
-
-    bool hasFiles = false;
-    for (const auto& entry : std::filesystem::directory_iterator(output_directory)) {
-        if (entry.path().extension() == ".cs") { hasFiles = true; break; }
-    }
-    if (!hasFiles) return false;
-
     HMODULE hGA = GetModuleHandleW(L"GameAssembly.dll");
     if (!hGA) return false;
 
@@ -1692,15 +2107,30 @@ bool AreWrappersFresh(const std::string& output_directory) {
     if (GetModuleFileNameW(hGA, gaPath, MAX_PATH) == 0) return false;
 
     try {
-        auto gaTime = std::filesystem::last_write_time(gaPath);
+        // One directory pass: checks that wrappers exist and finds the oldest.
+        // directory_entry times come from the directory enumeration itself, so
+        // no file is opened or stat'ed separately.
+        bool hasFiles = false;
         std::filesystem::file_time_type oldestWrapper = (std::filesystem::file_time_type::max)();
 
-        for (const auto& entry : std::filesystem::directory_iterator(output_directory)) {
-            if (entry.path().extension() == ".cs") {
-                auto wTime = std::filesystem::last_write_time(entry.path());
-                if (wTime < oldestWrapper) oldestWrapper = wTime;
-            }
+        std::error_code ec;
+        for (const auto& entry : std::filesystem::directory_iterator(output_directory, ec)) {
+            if (entry.path().extension() != ".cs") continue;
+            hasFiles = true;
+            auto wTime = entry.last_write_time();
+            if (wTime < oldestWrapper) oldestWrapper = wTime;
         }
+        if (ec || !hasFiles) return false;
+
+        auto gaTime = std::filesystem::last_write_time(gaPath);
+
+        // Generation stamp present: it is newer than any file the last run wrote,
+        // and unchanged files were deliberately left with their older timestamps
+        auto stampTime = std::filesystem::last_write_time(
+            std::filesystem::path(output_directory) / WRAPPERS_STAMP_FILE, ec);
+        if (!ec) return stampTime > gaTime;
+
+        // No stamp (wrappers from an older build): date them by the oldest file
         return oldestWrapper > gaTime;
     } catch (...) {
         return false;
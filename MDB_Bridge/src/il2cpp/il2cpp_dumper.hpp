@@ -23,6 +23,7 @@ struct DumpResult {
     size_t total_assemblies;
     std::vector<std::string> generated_files;      // Paths to generated .cs wrapper files
     size_t total_wrappers_generated;
+    size_t unchanged_files;                        // Wrapper files left as-is (content identical)
     // BeeByte detection stats
     size_t fake_methods_detected;
     size_t fake_classes_detected;
@@ -616,7 +616,7 @@ namespace il2cpp {
 		// dereferenced function pointers (valid after ensure_exports())
 		inline void* (__fastcall* il2cpp_domain_get) (void) = nullptr;
 		inline void* (__fastcall* il2cpp_thread_attach)(void*) = nullptr;
-		inline void* (__fastcall* il2cpp_thread_detach)(void) = nullptr;
+		inline void (__fastcall* il2cpp_thread_detach)(void*) = nullptr;
 		inline unity_structs::il2cppAssembly** (__fastcall* il2cpp_domain_get_assemblies)(void*, size_t*) = nullptr;
 		inline unity_structs::il2cppClass* (__fastcall* il2cpp_class_from_name)(unity_structs::il2cppImage*, const char*, const char*) = nullptr;
 		inline unity_structs::il2cppMethodInfo* (__fastcall* il2cpp_class_get_method_from_name)(unity_structs::il2cppClass*, const char*, int) = nullptr;
@@ -716,6 +716,7 @@ namespace il2cpp {
 				auto r = resolve_export<std::remove_reference_t<decltype(dst)>>(name);
 				if (r && r.value) dst = r.value;
 			};
+			try_bind(il2cpp_thread_detach,           "il2cpp_thread_detach");
 			try_bind(il2cpp_assembly_get_image,      "il2cpp_assembly_get_image");
 			try_bind(il2cpp_image_get_name,           "il2cpp_image_get_name");
 			try_bind(il2cpp_image_get_class_count,    "il2cpp_image_get_class_count");
@@ -1176,7 +1177,6 @@ namespace il2cpp {
 	}
 
 	inline void cleanup() {
-		if (_internal::il2cpp_thread_detach) _internal::il2cpp_thread_detach();
 		std::scoped_lock lk(_internal::g_cache_mtx);
 		_internal::g_assembly_cache.clear();
 	}
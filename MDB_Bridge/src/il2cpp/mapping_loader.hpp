@@ -14,6 +14,8 @@
 // SymbolType: 0=Type, 1=Field, 2=Property, 3=Method
 
 #include <string>
+#include <string_view>
+#include <charconv>
 #include <unordered_map>
 #include <fstream>
 #include <sstream>
@@ -36,6 +38,7 @@ public:
 
         type_map_.clear();
         member_map_.clear();
+        member_count_ = 0;
 
         auto objects = SplitJsonObjects(json);
         for (const auto& obj : objects) {
@@ -50,11 +53,10 @@ public:
                 // Type (class, enum, interface, struct, delegate)
                 type_map_[obfName] = friendlyName;
             } else {
-                // Member (field=1, property=2, method=3)
-                std::string key = parentType.empty()
-                    ? obfName
-                    : (parentType + "::" + obfName);
-                member_map_[key] = friendlyName;
+                // Member (field=1, property=2, method=3); parent-less members live under ""
+                auto& members = member_map_[parentType];
+                auto inserted = members.insert_or_assign(std::move(obfName), std::move(friendlyName));
+                if (inserted.second) ++member_count_;
             }
         }
 
@@ -62,39 +64,55 @@ public:
     }
 
     /// Look up a type's friendly name by its obfuscated name.
-    /// Returns empty string if not found.
-    std::string ResolveType(const std::string& obfuscated_name) const {
+    /// Returns empty string if not found. The reference stays valid until the next Load().
+    const std::string& ResolveType(const std::string& obfuscated_name) const {
         auto it = type_map_.find(obfuscated_name);
-        return (it != type_map_.end()) ? it->second : std::string();
+        return (it != type_map_.end()) ? it->second : EmptyName();
     }
 
     /// Look up a member's friendly name by parent type + member obfuscated name.
-    /// Returns empty string if not found.
-    std::string ResolveMember(const std::string& parent_obf, const std::string& member_obf) const {
+    /// Returns empty string if not found. The reference stays valid until the next Load().
+    const std::string& ResolveMember(const std::string& parent_obf, const std::string& member_obf) const {
         // Try with parent context first
         if (!parent_obf.empty()) {
-            auto it = member_map_.find(parent_obf + "::" + member_obf);
-            if (it != member_map_.end()) return it->second;
+            const std::string& friendly = FindMember(parent_obf, member_obf);
+            if (!friendly.empty()) return friendly;
         }
         // Fall back to standalone lookup (no parent context)
-        auto it = member_map_.find(member_obf);
-        return (it != member_map_.end()) ? it->second : std::string();
+        return FindMember(std::string(), member_obf);
     }
 
     bool HasMappings() const { return !type_map_.empty() || !member_map_.empty(); }
     size_t TypeCount() const { return type_map_.size(); }
-    size_t MemberCount() const { return member_map_.size(); }
-    size_t TotalCount() const { return type_map_.size() + member_map_.size(); }
+    size_t MemberCount() const { return member_count_; }
+    size_t TotalCount() const { return type_map_.size() + member_count_; }
 
 private:
     std::unordered_map<std::string, std::string> type_map_;    // obf_name -> friendly
-    std::unordered_map<std::string, std::string> member_map_;  // "parent::member" -> friendly
+    // parent -> (member -> friendly); looked up without building a combined key
+    std::unordered_map<std::string, std::unordered_map<std::string, std::string>> member_map_;
+    size_t member_count_ = 0;
+
+    const std::string& FindMember(const std::string& parent, const std::string& member) const {
+        auto parentIt = member_map_.find(parent);
+        if (parentIt == member_map_.end()) return EmptyName();
+        auto it = parentIt->second.find(member);
+        return (it != parentIt->second.end()) ? it->second : EmptyName();
+    }
+
+    static const std::string& EmptyName() {
+        static const std::string empty;
+        return empty;
+    }
 
     // ---- Minimal JSON helpers (no external dependency) ----
+    // All helpers work on views into the loaded file buffer, so a mapping file
+    // with tens of thousands of entries is scanned without per-object copies.
 
-    /// Split a JSON array string into individual object strings.
-    static std::vector<std::string> SplitJsonObjects(const std::string& json) {
-        std::vector<std::string> objects;
+    /// Split a JSON array string into views of the individual objects.
+    /// The views point into `json`, which must outlive them.
+    static std::vector<std::string_view> SplitJsonObjects(std::string_view json) {
+        std::vector<std::string_view> objects;
         int depth = 0;
         size_t start = 0;
         bool inString = false;
@@ -120,23 +138,37 @@ private:
         return objects;
     }
 
+    /// Find the start of the value for `key` (the position after its ':' and any
+    /// whitespace). Only matches a quoted token followed by ':', so neither a key
+    /// name inside another value nor a value equal to the key name (as in
+    /// "FriendlyName":"ParentType") is mistaken for the key itself.
+    /// Returns npos if the key is not present.
+    static size_t FindJsonValue(std::string_view json, std::string_view key) {
+        auto skipWhitespace = [&](size_t pos) {
+            while (pos < json.size() && (json[pos] == ' ' || json[pos] == '\t' ||
+                   json[pos] == '\n' || json[pos] == '\r'))
+                pos++;
+            return pos;
+        };
+
+        size_t pos = 0;
+        while ((pos = json.find(key, pos)) != std::string_view::npos) {
+            size_t end = pos + key.size();
+            if (pos > 0 && json[pos - 1] == '"' && end < json.size() && json[end] == '"') {
+                size_t colon = skipWhitespace(end + 1);
+                if (colon < json.size() && json[colon] == ':') {
+                    return skipWhitespace(colon + 1);
+                }
+            }
+            pos = end;
+        }
+        return std::string_view::npos;
+    }
+
     /// Extract a string value for a given key from a JSON object string.
     /// Returns empty string if key not found or value is null.
-    static std::string ExtractJsonString(const std::string& json, const std::string& key) {
-        std::string pattern = "\"" + key + "\"";
-        size_t pos = json.find(pattern);
-        if (pos == std::string::npos) return "";
-
-        pos += pattern.size();
-        pos = json.find(':', pos);
-        if (pos == std::string::npos) return "";
-        pos++;
-
-        // Skip whitespace
-        while (pos < json.size() && (json[pos] == ' ' || json[pos] == '\t' ||
-               json[pos] == '\n' || json[pos] == '\r'))
-            pos++;
-
+    static std::string ExtractJsonString(std::string_view json, std::string_view key) {
+        size_t pos = FindJsonValue(json, key);
         if (pos >= json.size()) return "";
         if (json[pos] == 'n') return "";  // null
         if (json[pos] != '"') return "";  // not a string value
@@ -164,27 +196,14 @@ private:
     }
 
     /// Extract an integer value for a given key from a JSON object string.
-    static int ExtractJsonInt(const std::string& json, const std::string& key, int defaultVal = -1) {
-        std::string pattern = "\"" + key + "\"";
-        size_t pos = json.find(pattern);
-        if (pos == std::string::npos) return defaultVal;
-
-        pos += pattern.size();
-        pos = json.find(':', pos);
-        if (pos == std::string::npos) return defaultVal;
-        pos++;
-
-        while (pos < json.size() && (json[pos] == ' ' || json[pos] == '\t' ||
-               json[pos] == '\n' || json[pos] == '\r'))
-            pos++;
-
+    static int ExtractJsonInt(std::string_view json, std::string_view key, int defaultVal = -1) {
+        size_t pos = FindJsonValue(json, key);
         if (pos >= json.size()) return defaultVal;
 
-        try {
-            return std::stoi(json.substr(pos));
-        } catch (...) {
-            return defaultVal;
-        }
+        int value = defaultVal;
+        auto [end, ec] = std::from_chars(json.data() + pos, json.data() + json.size(), value);
+        (void)end;
+        return (ec == std::errc()) ? value : defaultVal;
     }
 };
 
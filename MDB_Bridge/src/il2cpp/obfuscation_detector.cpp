@@ -10,8 +10,10 @@
 #include <chrono>
 #include <iomanip>
 #include <ctime>
+#include <cstring>
 #include <filesystem>
 #include <map>
+#include <string_view>
 
 namespace api = il2cpp::_internal;
 using namespace il2cpp::_internal::unity_structs;
@@ -94,9 +96,9 @@ bool Detector::IsStubPattern(uintptr_t address) const {
 bool Detector::IsWhitelistedImage(const char* imageName) const {
     if (!imageName || !imageName[0]) return false;
 
-    std::string name(imageName);
+    // Prefix compare straight on the metadata string — no std::string copy
     for (const auto& prefix : m_config.assembly_prefixes_whitelist) {
-        if (name.compare(0, prefix.size(), prefix) == 0) {
+        if (std::strncmp(imageName, prefix.c_str(), prefix.size()) == 0) {
             return true;
         }
     }
@@ -119,10 +121,7 @@ bool Detector::IsGenericClassName(const char* className) {
     if (!className) return false;
     // Standard .NET naming: generic classes have backtick + arity
     // e.g. "List`1", "Dictionary`2", "Action`3"
-    for (const char* p = className; *p; ++p) {
-        if (*p == '`') return true;
-    }
-    return false;
+    return std::strchr(className, '`') != nullptr;
 }
 
 // ============================================================================
@@ -134,13 +133,12 @@ bool Detector::IsObfuscatedName(const char* name) {
 
     // BeeByte obfuscation pattern: exactly 11 uppercase ASCII characters
     // e.g. AJLPLCGICMF, FPGHODFCFKC, KLFGNILMCJN
-    size_t len = 0;
-    for (const char* p = name; *p; ++p) {
-        if (*p < 'A' || *p > 'Z') return false;
-        len++;
-        if (len > 11) return false; // too long
+    // The terminator fails the range test too, so the loop also rejects short
+    // names; name[11] is only read once 11 uppercase characters were seen.
+    for (int i = 0; i < 11; ++i) {
+        if (name[i] < 'A' || name[i] > 'Z') return false;
     }
-    return len == 11;
+    return name[11] == '\0';
 }
 
 // ============================================================================
@@ -211,6 +209,7 @@ std::string Detector::BuildMethodSignature(const il2cppMethodInfo* method,
 
 void Detector::CollectMethodPointers(il2cppAssembly** assemblies, size_t count) {
     m_pointer_map.clear();
+    m_stub_pointers.clear();
     m_total_methods = 0;
     m_whitelisted_methods = 0;
     m_generic_skipped = 0;
@@ -261,7 +260,7 @@ void Detector::CollectMethodPointers(il2cppAssembly** assemblies, size_t count)
     // Identify stub pointers: any pointer shared by >= threshold methods
     for (const auto& [ptr, methods] : m_pointer_map) {
         if (methods.size() >= m_config.pointer_sharing_threshold) {
-            m_stub_pointers.insert(ptr);
+            m_stub_pointers.emplace(ptr, methods.size());
         }
     }
 }
@@ -366,12 +365,10 @@ void Detector::ClassifyMethods(il2cppAssembly** assemblies, size_t count) {
                 }
 
                 // Step 2: Constructors and finalizers are always real
-                if (methodName) {
-                    std::string mName(methodName);
-                    if (mName == ".ctor" || mName == ".cctor" || mName == "Finalize") {
-                        classResult.real_methods++;
-                        continue;
-                    }
+                if (methodName && (std::strcmp(methodName, ".ctor") == 0 || std::strcmp(methodName, ".cctor") == 0 ||
+                                   std::strcmp(methodName, "Finalize") == 0)) {
+                    classResult.real_methods++;
+                    continue;
                 }
 
                 // Step 3: Generic classes — always real
@@ -409,7 +406,9 @@ void Detector::ClassifyMethods(il2cppAssembly** assemblies, size_t count) {
                 // Only flag if the method name looks obfuscated. Real methods
                 // (e.g. get_Position, Update) can share code via MSVC ICF with
                 // BeeByte stubs but are not themselves fake.
-                if (m_stub_pointers.count(ptr)) {
+                // One probe answers both "is this a stub?" and "how widely shared?"
+                auto stub = m_stub_pointers.find(ptr);
+                if (stub != m_stub_pointers.end()) {
                     bool nameIsObfuscated = IsObfuscatedName(methodName);
 
                     if (nameIsObfuscated) {
@@ -420,7 +419,7 @@ void Detector::ClassifyMethods(il2cppAssembly** assemblies, size_t count) {
                         info.full_signature = BuildMethodSignature(method, fullName);
                         info.method_pointer = ptr;
                         info.reason = FakeReason::SharedMethodPointer;
-                        info.shared_count = m_pointer_map[ptr].size();
+                        info.shared_count = stub->second;
                         m_fake_methods.push_back(info);
                         m_fake_method_set.insert(method);
                         classResult.fake_methods++;
@@ -545,10 +544,7 @@ bool Detector::WriteFakeReport(const std::string& output_path) const {
     file << "// ============================================================================\n\n";
 
     // Sort stub pointers by usage count
-    std::vector<std::pair<uintptr_t, size_t>> sorted_stubs;
-    for (auto ptr : m_stub_pointers) {
-        sorted_stubs.push_back({ ptr, m_pointer_map.at(ptr).size() });
-    }
+    std::vector<std::pair<uintptr_t, size_t>> sorted_stubs(m_stub_pointers.begin(), m_stub_pointers.end());
     std::sort(sorted_stubs.begin(), sorted_stubs.end(),
               [](const auto& a, const auto& b) { return a.second > b.second; });
 
@@ -577,8 +573,12 @@ bool Detector::WriteFakeReport(const std::string& output_path) const {
     file << "// ENTIRELY FAKE CLASSES (" << m_fake_class_count << " detected)\n";
     file << "// ============================================================================\n\n";
 
+    // Remember the names while listing them, so Section 3 tags fake classes
+    // with one lookup instead of rescanning every analyzed class per group
+    std::unordered_set<std::string_view> fake_class_names;
     for (const auto& ca : m_class_analysis) {
         if (!ca.is_entirely_fake) continue;
+        fake_class_names.insert(ca.full_name);
         file << "// [FAKE CLASS] " << ca.full_name
              << " — " << ca.fake_methods << "/" << ca.total_methods << " methods are fake\n";
     }
@@ -595,17 +595,8 @@ bool Detector::WriteFakeReport(const std::string& output_path) const {
     }
 
     for (const auto& [className, methods] : by_class) {
-        // Check if this is an entirely fake class
-        bool isFakeClass = false;
-        for (const auto& ca : m_class_analysis) {
-            if (ca.full_name == className && ca.is_entirely_fake) {
-                isFakeClass = true;
-                break;
-            }
-        }
-
         file << "// --- " << className;
-        if (isFakeClass) file << " [ENTIRE CLASS IS FAKE]";
+        if (fake_class_names.count(className)) file << " [ENTIRE CLASS IS FAKE]";
         file << " ---\n";
 
         for (const auto* fm : methods) {
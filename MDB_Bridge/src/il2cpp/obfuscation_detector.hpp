@@ -171,8 +171,8 @@ private:
     // methodPointer -> list of MethodInfo* that share it
     std::unordered_map<uintptr_t, std::vector<const il2cpp::_internal::unity_structs::il2cppMethodInfo*>> m_pointer_map;
 
-    // Set of methodPointer addresses identified as stubs
-    std::unordered_set<uintptr_t> m_stub_pointers;
+    // methodPointer addresses identified as stubs -> number of methods sharing each
+    std::unordered_map<uintptr_t, size_t> m_stub_pointers;
 
     // Set of MethodInfo* addresses in vtable slots (whitelist)
     std::unordered_set<const void*> m_vtable_methods;